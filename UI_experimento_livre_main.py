@@ -1,21 +1,40 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
 import threading
 import time
 from datetime import datetime
 import os
 import queue
+import concurrent.futures
+from collections import deque
+from itertools import islice
 
 from config import Config
 from serial_comm import SerialCommunication
 from data_manager import DataManager
+import fast_kernels
 from version import APP_NAME, APP_VERSION, APP_AUTHOR
 
 class TribologyExperimentGUI:
     """Main GUI application for the tribology experiment control."""
+
+    # Refresh periods for the live plot (minimum) and the progress bar
+    PLOT_REFRESH_S = 0.25
+    PROGRESS_REFRESH_MS = 500
+    # Delay after the last canvas resize before the plot layout is recomputed
+    RELAYOUT_DELAY_MS = 150
+    # Delay before field edits are written to the config
+    CONFIG_DEBOUNCE_MS = 300
+    # Number of lines kept in the status log
+    STATUS_MAX_LINES = 100
+    # How often queued serial samples are picked up while connected
+    SERIAL_POLL_MS = 50
+    # How often finished background file operations are checked for, and how long closing waits for them
+    IO_POLL_MS = 50
+    IO_CLOSE_TIMEOUT_S = 10.0
+    # Data file types offered by the save/load dialogs
+    DATA_FILETYPES = [("CSV files", "*.csv"), ("Parquet files", "*.parquet"), ("Arrow/Feather files", "*.arrow *.feather"),
+                      ("All files", "*.*")]
     
     def __init__(self, root):
         self.root = root
@@ -29,22 +48,40 @@ class TribologyExperimentGUI:
         self.data_manager = DataManager(
             self.config.get("data_settings", "save_directory"),
             plot_max_points=plot_max_points,
-            auto_save=bool(self.config.get("data_settings", "auto_save"))
+            auto_save=bool(self.config.get("data_settings", "auto_save")),
+            live_format=self.config.get("data_settings", "live_format") or "csv",
+            output_format=self.config.get("data_settings", "output_format") or "csv"
         )
 
-        # Serial data arrives on a background thread; Tkinter must only be touched on the main thread.
-        self._serial_incoming_queue: "queue.Queue[dict]" = queue.Queue(maxsize=20000)
+        # File writes run on a single worker so the GUI stays responsive (and writes stay ordered).
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # The worker never touches Tk: finished futures are queued here and picked up by _poll_io on the Tk thread
+        self._io_done: "queue.Queue[tuple]" = queue.Queue()
+        self._io_pending = set()
+        self._io_poll_id = None
+
+        # Serial data arrives on a background thread and waits in serial_comm's queue (read via drain());
+        # Tkinter must only be touched on the main thread.
         
         # GUI state variables
         self.is_experiment_running = False
         self.experiment_start_time = None
+        self._plot_dirty = False
+        self._last_n_points = 0
+        self._last_plot_time = 0.0
+        self._redraw_scheduled = False
+        self._serial_poll_id = None
+        self._progress_after_id = None
+        self._config_after_id = None
+        self._refresh_cached_params()
         
         # Setup GUI
         self.setup_gui()
+        # Serial data is picked up by a Tk-side poll that runs only while connected (see _poll_serial)
         self.setup_serial_callback()
-        
-        # Start GUI update timer
-        self.update_gui()
+        # Compile the plot kernels on the I/O worker once the window is up, so the first plot refresh doesn't
+        self.root.after_idle(self._io_pool.submit, fast_kernels.warm_up)
+        # The progress / auto-stop timer only runs during an experiment (see _start_progress_ticks)
     
     def setup_gui(self):
         """Setup the main GUI layout."""
@@ -98,8 +135,10 @@ class TribologyExperimentGUI:
         params_frame = ttk.LabelFrame(config_frame, text="Experiment Parameters", padding=10)
         params_frame.pack(fill=tk.X, padx=10, pady=5)
         
+        params = self.config.get_experiment_params()
+
         # Force control mode checkbox
-        self.force_mode_var = tk.BooleanVar(value=self.config.get_experiment_params()["USE_FORCE_CONTROL_MODE"])
+        self.force_mode_var = tk.BooleanVar(value=params["USE_FORCE_CONTROL_MODE"])
         force_mode_cb = ttk.Checkbutton(params_frame, text="Use Force Control Mode", 
                                        variable=self.force_mode_var,
                                        command=self.on_force_mode_changed)
@@ -128,12 +167,12 @@ class TribologyExperimentGUI:
             label = ttk.Label(params_frame, text=label_text)
             label.grid(row=row, column=0, sticky=tk.W, pady=2)
             
-            var = tk.DoubleVar(value=self.config.get_experiment_params()[key])
+            var = tk.DoubleVar(value=params[key])
             self.param_vars[key] = var
             
             entry = ttk.Entry(params_frame, textvariable=var, width=15)
             entry.grid(row=row, column=1, padx=5, pady=2)
-            entry.bind('<FocusOut>', lambda e, k=key: self.update_config())
+            entry.bind('<FocusOut>', lambda e: self._schedule_config_update())
             
             # Store widgets (these are always visible, so no need to store for show/hide)
             row += 1
@@ -143,12 +182,12 @@ class TribologyExperimentGUI:
             label = ttk.Label(params_frame, text=label_text)
             label.grid(row=row, column=0, sticky=tk.W, pady=2)
             
-            var = tk.DoubleVar(value=self.config.get_experiment_params()[key])
+            var = tk.DoubleVar(value=params[key])
             self.param_vars[key] = var
             
             entry = ttk.Entry(params_frame, textvariable=var, width=15)
             entry.grid(row=row, column=1, padx=5, pady=2)
-            entry.bind('<FocusOut>', lambda e, k=key: self.update_config())
+            entry.bind('<FocusOut>', lambda e: self._schedule_config_update())
             
             # Store widgets for show/hide
             self.param_widgets[key] = {
@@ -233,6 +272,8 @@ class TribologyExperimentGUI:
         status_text_frame.pack(fill=tk.BOTH, expand=True)
         
         self.status_text = tk.Text(status_text_frame, height=10, width=60)
+        self._pending_logs = deque(maxlen=self.STATUS_MAX_LINES)
+        self._log_flush_scheduled = False
         status_scrollbar = ttk.Scrollbar(status_text_frame, orient=tk.VERTICAL, 
                                         command=self.status_text.yview)
         self.status_text.configure(yscrollcommand=status_scrollbar.set)
@@ -248,6 +289,10 @@ class TribologyExperimentGUI:
         """Setup data visualization tab."""
         data_frame = ttk.Frame(self.notebook)
         self.notebook.add(data_frame, text="Data & Analysis")
+        self._data_tab_idx = self.notebook.index(data_frame)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        # Restoring a minimized window must also catch the plot up
+        self.root.bind("<Map>", lambda e: e.widget is self.root and self.on_tab_changed(), add="+")
         
         # Data control frame
         data_control_frame = ttk.LabelFrame(data_frame, text="Data Control", padding=10)
@@ -266,50 +311,143 @@ class TribologyExperimentGUI:
         plot_frame = ttk.LabelFrame(data_frame, text="Real-time Data Plot", padding=10)
         plot_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        # Create matplotlib figure
+        # The figure is built the first time the plot is needed (see _ensure_plot)
+        self._plot_frame = plot_frame
+        self.fig = None
+        self._plot_needs_rescale = True
+
+    def _ensure_plot(self):
+        """Create the Matplotlib figure on first use, keeping Matplotlib's import off the startup path."""
+        if self.fig is not None:
+            return
+        import matplotlib
+        # Pin the Tk backend so Matplotlib doesn't probe for another GUI toolkit; plots are blitted on TkAgg.
+        matplotlib.use("TkAgg")
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        # One plot area: Force X on the left axis, Force Z on a twin right axis sharing the time axis,
+        # so each refresh restores and blits a single region.
         self.fig = Figure(figsize=(10, 6), dpi=100)
-        self.ax1 = self.fig.add_subplot(211)
-        self.ax2 = self.fig.add_subplot(212)
-        
-        self.canvas = FigureCanvasTkAgg(self.fig, plot_frame)
+        self.ax1 = self.fig.add_subplot(111)
+        self.ax2 = self.ax1.twinx()
+
+        self.canvas = FigureCanvasTkAgg(self.fig, self._plot_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
+
         # Initialize plots
         self.init_plots()
     
     def init_plots(self):
         """Initialize the data plots."""
-        self.ax1.set_title("Force X (N) vs Time")
-        self.ax1.set_xlabel("Time (s)")
-        self.ax1.set_ylabel("Force X (N)")
-        self.ax1.grid(True)
-        
-        self.ax2.set_title("Force Z (N) vs Time")
-        self.ax2.set_xlabel("Time (s)")
-        self.ax2.set_ylabel("Force Z (N)")
-        self.ax2.grid(True)
-        
+        if not hasattr(self, "line_x"):
+            self.ax1.set_title("Force X and Force Z (N) vs Time")
+            self.ax1.set_xlabel("Time (s)")
+            self.ax1.set_ylabel("Force X (N)", color='b')
+            self.ax1.tick_params(axis='y', colors='b')
+            self.ax1.grid(True)
+
+            self.ax2.set_ylabel("Force Z (N)", color='r')
+            self.ax2.tick_params(axis='y', colors='r')
+
+            # Animated lines are skipped by full redraws and blitted over the cached background.
+            (self.line_x,) = self.ax1.plot([], [], 'b-', linewidth=1, animated=True, label="Force X")
+            (self.line_z,) = self.ax2.plot([], [], 'r-', linewidth=1, animated=True, label="Force Z")
+            self.ax1.legend(handles=[self.line_x, self.line_z], loc='upper left')
+            self._bg = None
+
+            # Resizes (and any other full redraw) end in a draw_event; refresh the cached backgrounds there.
+            self.canvas.mpl_connect('draw_event', self._on_plot_draw)
+
+            # Layout is computed once here and only recomputed when the canvas is resized, never per update.
+            self.fig.tight_layout()
+            self._layout_after_id = None
+            self.canvas.mpl_connect('resize_event', self._on_canvas_resize)
+        else:
+            self.line_x.set_data([], [])
+            self.line_z.set_data([], [])
+
+        self._plot_needs_rescale = True
+        self.canvas.draw_idle()
+
+    def _on_canvas_resize(self, event):
+        """Recompute the subplot layout once the canvas has stopped resizing."""
+        # Dragging a window edge fires many resize events; tight_layout is only worth running for the last.
+        if self._layout_after_id is not None:
+            self.root.after_cancel(self._layout_after_id)
+        self._layout_after_id = self.root.after(self.RELAYOUT_DELAY_MS, self._relayout_plots)
+
+    def _relayout_plots(self):
+        """Apply tight_layout for the current canvas size and redraw."""
+        self._layout_after_id = None
         self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
+    def _on_plot_draw(self, event):
+        """Cache the axes background after a full redraw and paint the animated lines on top."""
+        self._bg = self.canvas.copy_from_bbox(self.ax1.bbox)
+        self.ax1.draw_artist(self.line_x)
+        self.ax2.draw_artist(self.line_z)
+
+    def _blit_plots(self):
+        """Redraw only the line artists over the cached background."""
+        if self._bg is None:
+            # No valid background yet; the pending full redraw paints the lines (see _on_plot_draw).
+            self.canvas.draw_idle()
+            return
+        # Both axes occupy the same bbox
+        self.canvas.restore_region(self._bg)
+        self.ax1.draw_artist(self.line_x)
+        self.ax2.draw_artist(self.line_z)
+        self.canvas.blit(self.ax1.bbox)
+
+    @staticmethod
+    def _padded_limits(lo, hi):
+        """Initial view limits: the data extents plus 10% headroom on each side."""
+        pad = 0.1 * (hi - lo) or 0.5
+        return lo - pad, hi + pad
+
+    @classmethod
+    def _grown_limits(cls, lim_lo, lim_hi, lo, hi, refit_below=None):
+        """Return limits covering [lo, hi], or None if the current ones already do.
+
+        Limits only grow, and each overflowing side is pushed out by the full
+        span, so a run re-renders the axes O(log N) times instead of every update.
+        With refit_below, limits are refitted to the data once it fills less
+        than that fraction of the span (e.g. a time window scrolling forward).
+        """
+        if lo >= lim_lo and hi <= lim_hi:
+            if refit_below is not None and (hi - lo) < refit_below * (lim_hi - lim_lo):
+                return cls._padded_limits(lo, hi)
+            return None
+        new_lo, new_hi = min(lim_lo, lo), max(lim_hi, hi)
+        span = new_hi - new_lo
+        if lo < lim_lo:
+            new_lo -= span
+        if hi > lim_hi:
+            new_hi += span
+        return new_lo, new_hi
     
     def setup_serial_callback(self):
         """Setup callback for serial data."""
         self.serial_comm.set_data_callback(self._on_serial_data_thread)
 
     def _on_serial_data_thread(self, data):
-        """Called from the serial reader thread; never touch Tkinter here."""
-        try:
-            self._serial_incoming_queue.put_nowait(data)
-        except queue.Full:
-            # Drop oldest to make room
-            try:
-                self._serial_incoming_queue.get_nowait()
-            except queue.Empty:
-                pass
-            try:
-                self._serial_incoming_queue.put_nowait(data)
-            except queue.Full:
-                pass
+        """Called from the serial reader thread; never touch Tkinter here (a Tk call would wait on the Tk thread)."""
+        # Map the sensor source in place before the sample is queued, so the Tk thread only consumes ready records
+        self.map_sensor_source(data)
+
+    def _start_serial_poll(self):
+        """Start the serial queue poll unless it is already running."""
+        if self._serial_poll_id is None:
+            self._serial_poll_id = self.root.after(self.SERIAL_POLL_MS, self._poll_serial)
+
+    def _poll_serial(self):
+        """Drain queued serial samples (Tk thread); keeps polling while connected or samples remain."""
+        self._serial_poll_id = None
+        self.update_gui()
+        if self.serial_comm.is_connected or self.serial_comm.data_queue:
+            self._start_serial_poll()
 
     def setup_sensors_tab(self):
         """Setup live sensors (load cells) tab."""
@@ -323,6 +461,8 @@ class TribologyExperimentGUI:
         cards.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Variables to display
+        # Last text set on each live-sensor var (see _set_live_text)
+        self._live_text = {}
         self.lc_time_var = tk.StringVar(value="—")
         self.lc_x_var = tk.StringVar(value="—")
         self.lc_z_var = tk.StringVar(value="—")
@@ -351,9 +491,21 @@ class TribologyExperimentGUI:
         x_card.grid(row=0, column=1, sticky="nsew", padx=8, pady=8)
         z_card.grid(row=0, column=2, sticky="nsew", padx=8, pady=8)
     
-    def refresh_ports(self):
-        """Refresh available serial ports."""
-        ports = self.serial_comm.get_available_ports()
+    def refresh_ports(self, max_age_s=None):
+        """Refresh available serial ports (enumerated off the Tk thread; a list from the last few seconds is reused)."""
+        self._run_io(self._on_ports_listed, self.serial_comm.get_available_ports, max_age_s)
+
+    def _on_ports_listed(self, future):
+        """Receive the port list from the I/O worker (Tk thread)."""
+        try:
+            ports = future.result()
+        except Exception as e:
+            self.log_status(f"Error listing serial ports: {e}")
+            return
+        self._apply_port_list(ports)
+
+    def _apply_port_list(self, ports):
+        """Show the given ports in the port selector."""
         self.port_combo['values'] = ports
         if ports and not self.port_var.get() in ports:
             self.port_var.set(ports[0])
@@ -374,9 +526,12 @@ class TribologyExperimentGUI:
             self.connection_status.set("Connected")
             self.connect_button.config(text="Disconnect")
             self.log_status(f"Connected to {port} at {baudrate} baud")
+            self._start_serial_poll()
         else:
             self.connection_status.set("Connection Failed")
             self.log_status(f"Failed to connect to {port}")
+            # The device may have been unplugged or renamed; re-enumerate instead of trusting the cache
+            self.refresh_ports(max_age_s=0)
     
     def disconnect_serial(self):
         """Disconnect from serial port."""
@@ -384,22 +539,50 @@ class TribologyExperimentGUI:
         self.connection_status.set("Disconnected")
         self.connect_button.config(text="Connect")
         self.log_status("Disconnected from serial port")
+        if self.serial_comm.dropped:
+            self.log_status(f"Warning: {self.serial_comm.dropped} samples were dropped because the GUI could not keep up")
     
+    def _schedule_config_update(self):
+        """Coalesce field edits (e.g. tabbing through the form) into one update_config call."""
+        if self._config_after_id is not None:
+            self.root.after_cancel(self._config_after_id)
+        self._config_after_id = self.root.after(self.CONFIG_DEBOUNCE_MS, self.update_config)
+
     def update_config(self):
         """Update configuration with current GUI values."""
-        # Update experiment parameters
-        self.config.set_experiment_param("USE_FORCE_CONTROL_MODE", self.force_mode_var.get())
-        
-        for key, var in self.param_vars.items():
-            self.config.set_experiment_param(key, var.get())
-        
-        # Update serial settings
-        self.config.set("serial_settings", "port", self.port_var.get())
-        self.config.set("serial_settings", "baudrate", self.baudrate_var.get())
+        if self._config_after_id is not None:
+            # Runs now; a pending debounced update is redundant
+            self.root.after_cancel(self._config_after_id)
+            self._config_after_id = None
 
-        # Update data/sensor settings
-        if hasattr(self, "sensor_source_var"):
-            self.config.set("data_settings", "sensor_source", self.sensor_source_var.get())
+        # One config.json write for the whole update
+        with self.config:
+            # Update experiment parameters
+            self.config.set_experiment_param("USE_FORCE_CONTROL_MODE", self.force_mode_var.get())
+
+            for key, var in self.param_vars.items():
+                self.config.set_experiment_param(key, var.get())
+
+            # Update serial settings
+            self.config.set("serial_settings", "port", self.port_var.get())
+            self.config.set("serial_settings", "baudrate", self.baudrate_var.get())
+
+            # Update data/sensor settings
+            if hasattr(self, "sensor_source_var"):
+                self.config.set("data_settings", "sensor_source", self.sensor_source_var.get())
+
+        self._refresh_cached_params()
+
+    def _refresh_cached_params(self):
+        """Cache configuration values read on every GUI tick; call whenever the config changes."""
+        self._cached_duration = float(self.config.get_experiment_params()["EXPERIMENT_DURATION_S"])
+        # (preferred, fallback) sample keys per axis, read by map_sensor_source on the serial thread
+        if (self.config.get("data_settings", "sensor_source") or "simple_fixed") == "free_sphere":
+            self._fx_keys, self._fz_keys = ("fx", "force_x"), ("fz", "force_z")
+        else:  # simple_fixed
+            self._fx_keys, self._fz_keys = ("fixed_x", "force_x"), ("fixed_z", "force_z")
+        interval_ms = int(self.config.get("data_settings", "plot_update_interval") or 100)
+        self._cached_plot_interval_s = max(self.PLOT_REFRESH_S, interval_ms / 1000.0)
     
     def save_config(self):
         """Save current configuration to file."""
@@ -427,6 +610,7 @@ class TribologyExperimentGUI:
     
     def update_gui_from_config(self):
         """Update GUI elements from loaded configuration."""
+        self._refresh_cached_params()
         params = self.config.get_experiment_params()
         self.force_mode_var.set(params["USE_FORCE_CONTROL_MODE"])
         
@@ -478,10 +662,12 @@ class TribologyExperimentGUI:
         
         # Start data collection
         self.data_manager.start_experiment()
+        self._plot_needs_rescale = True
+        self._last_n_points = 0
 
         # Reset experiment time indicator
         if hasattr(self, "lc_time_var"):
-            self.lc_time_var.set("0.00")
+            self._set_live_text(self.lc_time_var, "0.00")
         
         # Send start command to device
         if self.serial_comm.start_experiment():
@@ -493,6 +679,7 @@ class TribologyExperimentGUI:
             self.stop_button.config(state=tk.NORMAL)
             self.progress_var.set(0)
             self.progress_label.set("Experiment Running...")
+            self._start_progress_ticks()
             
             self.log_status("Experiment started successfully")
         else:
@@ -504,8 +691,10 @@ class TribologyExperimentGUI:
         # Send stop command to device
         self.serial_comm.stop_experiment()
         
-        # Stop data collection
-        self.data_manager.stop_experiment()
+        # Stop data collection; closing the live file can wait on a stalled disk, so the I/O worker does it
+        # (ahead of any save queued after this)
+        run_id = self.data_manager.stop_acquisition()
+        self._run_io(self._on_live_file_closed, self.data_manager.finish_live_file, run_id)
         
         # Update GUI state
         self.is_experiment_running = False
@@ -516,102 +705,124 @@ class TribologyExperimentGUI:
 
         # Reset experiment time indicator
         if hasattr(self, "lc_time_var"):
-            self.lc_time_var.set("0.00")
+            self._set_live_text(self.lc_time_var, "0.00")
         
         self.log_status("Experiment stopped")
     
     def handle_serial_data(self, data):
         """Handle incoming serial data (must be called on the Tkinter/main thread)."""
-        # Choose mapping for sensors based on selection
-        source = self.config.get("data_settings", "sensor_source") or "simple_fixed"
+        self.handle_serial_batch([self.map_sensor_source(data)])
 
+    def map_sensor_source(self, data):
+        """Set force_x/force_z on the sample from the selected sensor source, in place (no Tk access)."""
         # Determine force values based on preferred source
-        preferred_fx = None
-        preferred_fz = None
-
-        if source == "free_sphere":
-            preferred_fx = data.get("fx", data.get("force_x"))
-            preferred_fz = data.get("fz", data.get("force_z"))
-        else:  # simple_fixed
-            preferred_fx = data.get("fixed_x", data.get("force_x"))
-            preferred_fz = data.get("fixed_z", data.get("force_z"))
+        fx_key, fx_fallback = self._fx_keys
+        fz_key, fz_fallback = self._fz_keys
+        preferred_fx = data.get(fx_key, data.get(fx_fallback))
+        preferred_fz = data.get(fz_key, data.get(fz_fallback))
 
-
-        # Build mapped record for data manager
-        mapped = dict(data)
+        # The parsed dict is created per line by SerialCommunication, so it is updated rather than copied
         if preferred_fx is not None:
-            mapped["force_x"] = preferred_fx
+            data["force_x"] = preferred_fx
         if preferred_fz is not None:
-            mapped["force_z"] = preferred_fz
+            data["force_z"] = preferred_fz
+        return data
+
+    def handle_serial_batch(self, mapped_batch):
+        """Handle a batch of samples already passed through map_sensor_source (Tkinter/main thread)."""
+        messages = [f"Device: {data['message']}" for data in mapped_batch if "message" in data]
 
-        # Add data to manager
-        self.data_manager.add_data_point(mapped)
+        # Add data to manager in one call
+        self.data_manager.add_data_points(mapped_batch)
         
         # Log messages
-        if "message" in data:
-            self.log_status(f"Device: {data['message']}")
+        if messages:
+            self.log_status_lines(messages)
         
-        # Update live sensors tab values when present.
+        # Update live sensors tab values when present; only the newest value of the batch is visible.
         # Keep the experiment time indicator stable when the experiment is stopped.
         if self.is_experiment_running:
             try:
-                self.lc_time_var.set(f"{float(self.data_manager.get_last_elapsed_time()):.2f}")
+                self._set_live_text(self.lc_time_var, f"{float(self.data_manager.get_last_elapsed_time()):.2f}")
             except Exception:
                 pass
-        if "force_x" in mapped:
-            try:
-                self.lc_x_var.set(f"{float(mapped['force_x']):.3f}")
-            except Exception:
-                self.lc_x_var.set(str(mapped.get("force_x")))
-        if "force_z" in mapped:
-            try:
-                self.lc_z_var.set(f"{float(mapped['force_z']):.3f}")
-            except Exception:
-                self.lc_z_var.set(str(mapped.get("force_z")))
+        last_fx = next((m["force_x"] for m in reversed(mapped_batch) if "force_x" in m), None)
+        last_fz = next((m["force_z"] for m in reversed(mapped_batch) if "force_z" in m), None)
+        if last_fx is not None:
+            self._set_live_text(self.lc_x_var, self._format_force(last_fx))
+        if last_fz is not None:
+            self._set_live_text(self.lc_z_var, self._format_force(last_fz))
+
+    def _set_live_text(self, var, text):
+        """Set a live-sensor StringVar only when its text changes; each set re-renders the bound label."""
+        name = str(var)
+        if self._live_text.get(name) != text:
+            self._live_text[name] = text
+            var.set(text)
+
+    @staticmethod
+    def _format_force(value):
+        """Format a force reading for the live sensor labels."""
+        try:
+            return f"{float(value):.3f}"
+        except (TypeError, ValueError):
+            return str(value)
     
     def update_plots(self):
         """Update the data plots."""
-        df = self.data_manager.get_current_data()
-        if df.empty:
+        self._ensure_plot()
+        x, fx, fz = self.data_manager.get_plot_arrays()
+        if len(x) == 0:
             return
 
-        # Lazily create line objects once, then only update data (much faster for long runs).
-        if not hasattr(self, "_line_fx"):
-            (self._line_fx,) = self.ax1.plot([], [], 'b-', linewidth=1)
-            self.ax1.set_title("Force X (N) vs Time")
-            self.ax1.set_xlabel("Time (s)")
-            self.ax1.set_ylabel("Force X (N)")
-            self.ax1.grid(True)
-
-        if not hasattr(self, "_line_fz"):
-            (self._line_fz,) = self.ax2.plot([], [], 'r-', linewidth=1)
-            self.ax2.set_title("Force Z (N) vs Time")
-            self.ax2.set_xlabel("Time (s)")
-            self.ax2.set_ylabel("Force Z (N)")
-            self.ax2.grid(True)
+        rescale = False
 
-        if "time" in df.columns:
-            x = df["time"].to_numpy()
+        # The canvas can't show more than a couple of points per pixel column; decimate before drawing.
+        n_out = int(2 * self.ax1.bbox.width)
+        decimate = 3 <= n_out < len(x)
 
-            if "force_x" in df.columns and not df["force_x"].isna().all():
-                y = df["force_x"].to_numpy()
-                self._line_fx.set_data(x, y)
-                self.ax1.relim()
-                self.ax1.autoscale_view()
+        has_fx, has_fz = self.data_manager.has_fx, self.data_manager.has_fz
+        # Time follows the visible window (it scrolls once the buffers wrap); forces use running extents.
+        t_lo, t_hi = fast_kernels.minmax(x)
+        _, fx_extent, fz_extent = self.data_manager.get_plot_extents()
+        for ax, line, y, has_data, (y_lo, y_hi) in (
+            (self.ax1, self.line_x, fx, has_fx, fx_extent),
+            (self.ax2, self.line_z, fz, has_fz, fz_extent),
+        ):
+            if has_data and t_lo <= t_hi:
+                if decimate:
+                    idx = fast_kernels.lttb_indices(x, y, n_out)
+                    line.set_data(x[idx], y[idx])
+                else:
+                    line.set_data(x, y)
 
-            if "force_z" in df.columns and not df["force_z"].isna().all():
-                y = df["force_z"].to_numpy()
-                self._line_fz.set_data(x, y)
-                self.ax2.relim()
-                self.ax2.autoscale_view()
+                # Fixed limits keep the blitted background valid; they change only when the data outgrows them.
+                if self._plot_needs_rescale:
+                    xlim = self._padded_limits(t_lo, t_hi)
+                    ylim = self._padded_limits(y_lo, y_hi)
+                else:
+                    xlim = self._grown_limits(*ax.get_xlim(), t_lo, t_hi, refit_below=0.25)
+                    ylim = self._grown_limits(*ax.get_ylim(), y_lo, y_hi)
+                if xlim is not None:
+                    ax.set_xlim(*xlim)
+                    rescale = True
+                if ylim is not None:
+                    ax.set_ylim(*ylim)
+                    rescale = True
 
-        self.canvas.draw_idle()
+        if rescale:
+            # Ticks and labels change with the limits, so the background must be re-rendered.
+            # The old one is stale until that redraw runs; drop it so nothing is blitted over it.
+            self._plot_needs_rescale = False
+            self._bg = None
+            self.canvas.draw_idle()
+        else:
+            self._blit_plots()
     
     def update_progress(self):
         """Update experiment progress."""
         if self.is_experiment_running:
-            duration = self.config.get_experiment_params()["EXPERIMENT_DURATION_S"]
-            progress = self.data_manager.get_experiment_progress(duration)
+            progress = self.data_manager.get_experiment_progress(self._cached_duration)
             self.progress_var.set(progress)
             
             # Check if experiment should be finished
@@ -621,43 +832,112 @@ class TribologyExperimentGUI:
     
     def log_status(self, message):
         """Log a status message."""
+        self.log_status_lines([message])
+
+    def log_status_lines(self, messages):
+        """Log several status messages; the widget is updated once per idle cycle."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        full_message = f"[{timestamp}] {message}\n"
-        
-        self.status_text.insert(tk.END, full_message)
+        # Bounded: lines that would scroll out before the next flush are never inserted
+        self._pending_logs.extend(f"[{timestamp}] {message}\n" for message in messages)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_logs)
+
+    def _flush_logs(self):
+        """Write all pending status messages with a single insert/see."""
+        self._log_flush_scheduled = False
+        if not self._pending_logs:
+            return
+        self.status_text.insert(tk.END, "".join(self._pending_logs))
+        self._pending_logs.clear()
+
+        # Keep the widget at a constant size by dropping just the overflow from the top.
+        # Tk's own line index stays right even when a device message spans several lines.
+        lines = int(self.status_text.index("end-1c").split(".")[0]) - 1
+        overflow = lines - self.STATUS_MAX_LINES
+        if overflow > 0:
+            self.status_text.delete("1.0", f"{overflow + 1}.0")
         self.status_text.see(tk.END)
-        
-        # Limit status text length
-        lines = self.status_text.get(1.0, tk.END).count('\n')
-        if lines > 100:
-            self.status_text.delete(1.0, f"{lines-50}.0")
     
     def clear_status(self):
         """Clear status text."""
         self.status_text.delete(1.0, tk.END)
+        self._pending_logs.clear()
     
     def save_data(self):
         """Save experiment data."""
-        if self.data_manager.experiment_data:
+        if self.data_manager.has_experiment_data:
             filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+                defaultextension=f".{self.data_manager.output_format}",
+                filetypes=self.DATA_FILETYPES
             )
             if filename:
-                self.data_manager.save_experiment_data(os.path.basename(filename))
-                self.log_status(f"Data saved to {filename}")
+                self._submit_io(
+                    self.data_manager.save_experiment_data, os.path.basename(filename),
+                    done_message=f"Data saved to {filename}"
+                )
         else:
             messagebox.showinfo("Info", "No data to save")
+
+    def _submit_io(self, func, *args, done_message):
+        """Run a file operation on the I/O worker and log the outcome back on the Tk thread."""
+        self._run_io(lambda f: self._on_io_done(f, done_message), func, *args)
+
+    def _run_io(self, callback, func, *args):
+        """Run func(*args) on the I/O worker; callback(future) is called on the Tk thread once it is done."""
+        future = self._io_pool.submit(func, *args)
+        self._io_pending.add(future)
+        # Runs on the worker: only a thread-safe queue put (Tk calls from other threads can block on the Tk thread)
+        future.add_done_callback(lambda f: self._io_done.put((callback, f)))
+        if self._io_poll_id is None:
+            self._io_poll_id = self.root.after(self.IO_POLL_MS, self._poll_io)
+
+    def _poll_io(self):
+        """Hand finished background operations to their callbacks (Tk thread); polls only while some are pending."""
+        self._io_poll_id = None
+        while True:
+            try:
+                callback, future = self._io_done.get_nowait()
+            except queue.Empty:
+                break
+            self._io_pending.discard(future)
+            try:
+                callback(future)
+            except Exception as e:
+                print(f"I/O callback error: {e}")
+        if self._io_pending:
+            self._io_poll_id = self.root.after(self.IO_POLL_MS, self._poll_io)
+
+    def _on_live_file_closed(self, future):
+        """Report the experiment's live file once the I/O worker has closed it (Tk thread)."""
+        try:
+            path = future.result()
+        except Exception as e:
+            self.log_status(f"Error closing experiment data file: {e}")
+            return
+        if path and self.data_manager.auto_save:
+            self.log_status(f"Experiment data saved to {path}")
+
+    def _on_io_done(self, future, done_message):
+        """Report the result of a background file operation (Tk thread)."""
+        try:
+            future.result()
+        except Exception as e:
+            self.log_status(f"Error: {e}")
+            return
+        self.log_status(done_message)
     
     def load_data(self):
         """Load experiment data."""
         filename = filedialog.askopenfilename(
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=self.DATA_FILETYPES
         )
         if filename:
             df = self.data_manager.load_experiment_data(filename)
             if not df.empty:
-                self.data_manager.current_data = df
+                self.data_manager.set_current_data(df)
+                # The loaded data has nothing to do with the current axis limits
+                self._plot_needs_rescale = True
                 self.update_plots()
                 self.log_status(f"Data loaded from {filename}")
             else:
@@ -670,44 +950,99 @@ class TribologyExperimentGUI:
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
         )
         if filename:
-            self.data_manager.export_summary_report(filename)
-            self.log_status(f"Report exported to {filename}")
+            # Snapshot the statistics here; the data keeps changing while the report is written.
+            stats = self.data_manager.get_statistics()
+            self._submit_io(
+                self.data_manager.export_summary_report, filename, stats,
+                done_message=f"Report exported to {filename}"
+            )
     
     def clear_data(self):
         """Clear current data."""
         if messagebox.askyesno("Confirm", "Clear all current data?"):
             self.data_manager.clear_current_data()
-            self.init_plots()
+            if self.fig is not None:
+                self.init_plots()
             self.progress_var.set(0)
             self.progress_label.set("Ready")
             self.log_status("Data cleared")
     
     def update_gui(self):
-        """Main GUI update loop."""
+        """Drain queued serial data and schedule a rate-limited plot refresh."""
         try:
-            # Drain serial data queue on the Tkinter thread
-            processed = 0
-            while processed < 2000:
-                try:
-                    item = self._serial_incoming_queue.get_nowait()
-                except queue.Empty:
-                    break
-                self.handle_serial_data(item)
-                processed += 1
-
-            # Update plots if data is available
-            if self.data_manager.current_data is not None and not self.data_manager.current_data.empty:
-                self.update_plots()
-            
-            # Update progress
-            self.update_progress()
+            # Drain serial data queue on the Tkinter thread and hand it over as one batch
+            batch = list(islice(self.serial_comm.drain(), 2000))
+            if batch:
+                self.handle_serial_batch(batch)
+                # Only samples that reached the plot buffers need a redraw (not status lines)
+                n_points = self.data_manager.n_points
+                if n_points != self._last_n_points:
+                    self._last_n_points = n_points
+                    self._plot_dirty = True
+
+            # More than one batch queued: continue once pending events are handled
+            if self.serial_comm.data_queue:
+                self.root.after_idle(self.update_gui)
+
+            if self._plot_dirty:
+                self._schedule_redraw()
             
         except Exception as e:
             print(f"GUI update error: {e}")
-        
-        # Schedule next update
-        interval_ms = int(self.config.get("data_settings", "plot_update_interval") or 100)
-        self.root.after(max(20, interval_ms), self.update_gui)
+
+    def _schedule_redraw(self):
+        """Schedule one plot refresh, no sooner than the plot refresh period after the previous one."""
+        if self._redraw_scheduled:
+            return
+        self._redraw_scheduled = True
+        wait_s = self._cached_plot_interval_s - (time.monotonic() - self._last_plot_time)
+        self.root.after(max(0, int(wait_s * 1000)), self._maybe_redraw)
+
+    def _maybe_redraw(self):
+        """Refresh the plot if new samples arrived and it is visible."""
+        self._redraw_scheduled = False
+        if self._plot_dirty and self._is_plot_visible():
+            self._plot_dirty = False
+            self._last_plot_time = time.monotonic()
+            try:
+                self.update_plots()
+            except Exception as e:
+                print(f"GUI update error: {e}")
+
+    def _is_plot_visible(self):
+        """True if the Data tab is selected and the window is not minimized."""
+        return (
+            self.root.state() != "iconic" and
+            self.notebook.index(self.notebook.select()) == self._data_tab_idx
+        )
+
+    def on_tab_changed(self, event=None):
+        """Build the plot on first view and catch it up with data that arrived while it was hidden.
+
+        Runs when the Data tab is selected and when the main window is restored.
+        """
+        if not self._is_plot_visible():
+            return
+        self._ensure_plot()
+        if self._plot_dirty:
+            self._plot_dirty = False
+            self._last_plot_time = time.monotonic()
+            self.update_plots()
+
+    def _start_progress_ticks(self):
+        """Start the progress loop unless a tick is already pending."""
+        if self._progress_after_id is None:
+            self._progress_after_id = self.root.after(self.PROGRESS_REFRESH_MS, self._tick_progress)
+
+    def _tick_progress(self):
+        """Progress bar / auto-stop loop, independent of the plot refresh; stops with the experiment."""
+        self._progress_after_id = None
+        try:
+            self.update_progress()
+        except Exception as e:
+            print(f"Progress update error: {e}")
+        if self.is_experiment_running:
+            self._start_progress_ticks()
     
     def on_closing(self):
         """Handle application closing."""
@@ -717,7 +1052,14 @@ class TribologyExperimentGUI:
             else:
                 return
         
+        if self._config_after_id is not None:
+            # Don't lose an edit still waiting on the debounce
+            self.update_config()
+        self.config.flush()
         self.disconnect_serial()
+        # Give pending saves a bounded time to finish (the worker never waits on Tk, so this can't deadlock)
+        concurrent.futures.wait(list(self._io_pending), timeout=self.IO_CLOSE_TIMEOUT_S)
+        self._io_pool.shutdown(wait=False)
         self.root.destroy()
     
     def on_force_mode_changed(self):
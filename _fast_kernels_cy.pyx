@@ -0,0 +1,82 @@
+# cython: language_level=3
+"""
+Cython build of the fast_kernels plot kernels, for installs without Numba.
+
+Build in place with:  cythonize -i _fast_kernels_cy.pyx
+"""
+
+import numpy as np
+
+cimport cython
+from libc.math cimport fabs, INFINITY, NAN
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef void lttb(const float[::1] t, const float[::1] y, long long[::1] out_idx) noexcept nogil:
+    """Fill out_idx with Largest-Triangle-Three-Buckets picks (3 <= len(out_idx) < len(t))."""
+    cdef Py_ssize_t n = t.shape[0]
+    cdef Py_ssize_t n_out = out_idx.shape[0]
+    cdef double every = <double>(n - 2) / (n_out - 2)
+    cdef Py_ssize_t i, k, start, end, avg_start, avg_end, chosen
+    cdef Py_ssize_t a = 0
+    cdef double avg_t, avg_y, ta, ya, area, max_area
+
+    out_idx[0] = 0
+    out_idx[n_out - 1] = n - 1
+    for i in range(n_out - 2):
+        # Average point of the next bucket
+        avg_start = <Py_ssize_t>((i + 1) * every) + 1
+        avg_end = <Py_ssize_t>((i + 2) * every) + 1
+        if avg_end > n:
+            avg_end = n
+        avg_t = 0.0
+        avg_y = 0.0
+        for k in range(avg_start, avg_end):
+            avg_t += t[k]
+            avg_y += y[k]
+        avg_t /= avg_end - avg_start
+        avg_y /= avg_end - avg_start
+
+        # Point of the current bucket forming the largest triangle with the previous pick and that average
+        start = <Py_ssize_t>(i * every) + 1
+        end = <Py_ssize_t>((i + 1) * every) + 1
+        ta = t[a]
+        ya = y[a]
+        max_area = -1.0
+        chosen = start
+        for k in range(start, end):
+            area = fabs((ta - avg_t) * (y[k] - ya) - (ta - t[k]) * (avg_y - ya))
+            if area > max_area:
+                max_area = area
+                chosen = k
+        out_idx[i + 1] = chosen
+        a = chosen
+
+
+def lttb_indices(t, y, Py_ssize_t n_out):
+    """Same contract as fast_kernels.lttb_indices."""
+    out = np.empty(n_out, dtype=np.int64)
+    lttb(t, y, out)
+    return out
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple minmax(const float[::1] y):
+    """Return (min, max) of y ignoring NaN; (nan, nan) if there is no finite value."""
+    cdef double lo = INFINITY
+    cdef double hi = -INFINITY
+    cdef double v
+    cdef Py_ssize_t k
+    with nogil:
+        for k in range(y.shape[0]):
+            v = y[k]
+            if v < lo:
+                lo = v
+            if v > hi:
+                hi = v
+    if lo > hi:
+        return NAN, NAN
+    return lo, hi
@@ -20,11 +20,12 @@ if errorlevel 1 (
     exit /b 1
 )
 
-REM Clean previous builds
-echo Cleaning previous builds...
-if exist "build" rmdir /s /q "build"
-if exist "dist" rmdir /s /q "dist"
-if exist "__pycache__" rmdir /s /q "__pycache__"
+REM Clean previous builds only for "build_executable.bat --full"; build\ keeps PyInstaller's cache
+if /i "%~1"=="--full" (
+    echo Cleaning previous builds...
+    if exist "build" rmdir /s /q "build"
+    if exist "dist" rmdir /s /q "dist"
+)
 
 REM Build the executable
 echo Building executable with PyInstaller...
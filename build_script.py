@@ -2,25 +2,44 @@
 Build script for creating standalone executable using PyInstaller
 """
 
+import hashlib
 import os
 import subprocess
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Wheels for requirements.txt, rebuilt only when the requirements (or the Python build) change
+WHEELHOUSE = Path(".wheelhouse")
+
 def clean_build_dirs():
-    """Clean previous build directories."""
-    dirs_to_clean = ['build', 'dist', '__pycache__']
+    """Clean previous build directories (build/ holds PyInstaller's analysis cache, so only for --full)."""
+    dirs_to_clean = ['build', 'dist']
     for dir_name in dirs_to_clean:
         if os.path.exists(dir_name):
             print(f"Cleaning {dir_name}...")
             shutil.rmtree(dir_name)
 
+def _requirements_hash():
+    """SHA256 of requirements.txt plus the interpreter version and platform (wheels are specific to both)."""
+    digest = hashlib.sha256(Path("requirements.txt").read_bytes())
+    digest.update(f"{sys.version_info[:2]} {sys.platform}".encode())
+    return digest.hexdigest()
+
 def install_requirements():
-    """Install build requirements."""
+    """Install build requirements from the local wheelhouse, building it first if it is stale."""
     print("Installing/updating requirements...")
+    hash_file = WHEELHOUSE / ".hash"
+    req_hash = _requirements_hash()
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        if not hash_file.exists() or hash_file.read_text().strip() != req_hash:
+            print("Building wheelhouse...")
+            subprocess.check_call([sys.executable, "-m", "pip", "wheel", "-r", "requirements.txt", "-w", str(WHEELHOUSE)])
+            hash_file.write_text(req_hash)
+        # Offline install: no index lookups or resolver downloads
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--no-index", "--find-links", str(WHEELHOUSE),
+                               "-r", "requirements.txt"])
         return True
     except subprocess.CalledProcessError as e:
         print(f"Failed to install requirements: {e}")
@@ -37,6 +56,24 @@ def build_executable():
         print(f"Build failed: {e}")
         return False
 
+def _fast_copytree(src, dst, workers=8):
+    """Copy a directory tree, many files at once (robocopy /MT on Windows, else a thread pool)."""
+    if os.name == "nt" and shutil.which("robocopy"):
+        result = subprocess.run(["robocopy", str(src), str(dst), "/S", "/MT:16", "/NJH", "/NJS", "/NFL", "/NDL"])
+        # robocopy exit codes below 8 mean success (files copied, or nothing to copy)
+        if result.returncode < 8:
+            return
+        print(f"robocopy failed ({result.returncode}), copying with Python instead")
+
+    jobs = []
+    for root, _dirs, files in os.walk(src):
+        target = Path(dst) / Path(root).relative_to(src)
+        target.mkdir(parents=True, exist_ok=True)
+        jobs.extend((Path(root) / name, target / name) for name in files)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() re-raises the first copy error
+        list(pool.map(lambda job: shutil.copy2(*job), jobs))
+
 def create_portable_package():
     """Create a portable package with necessary files."""
     dist_dir = Path("dist")
@@ -68,7 +105,7 @@ def create_portable_package():
             if src_path.is_dir():
                 if dst_path.exists():
                     shutil.rmtree(dst_path)
-                shutil.copytree(src_path, dst_path)
+                _fast_copytree(src_path, dst_path)
             else:
                 shutil.copy2(src_path, dst_path)
     
@@ -89,8 +126,8 @@ if errorlevel 1 (
     print(f"Portable package created at: {portable_dir}")
     return True
 
-def main():
-    """Main build function."""
+def main(full: bool = False):
+    """Main build function; full=True (--full) rebuilds from scratch instead of reusing build/."""
     print("=" * 60)
     print("Tribology Experiment - Executable Builder")
     print("=" * 60)
@@ -101,8 +138,9 @@ def main():
         print("Make sure you're running this script from the project root directory.")
         return False
     
-    # Clean previous builds
-    clean_build_dirs()
+    # Clean previous builds only on request; an incremental build reuses PyInstaller's cache
+    if full:
+        clean_build_dirs()
     
     # Install requirements
     if not install_requirements():
@@ -128,7 +166,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        success = main()
+        success = main(full="--full" in sys.argv[1:])
         if not success:
             sys.exit(1)
     except KeyboardInterrupt:
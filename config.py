@@ -1,5 +1,9 @@
 import json
 import os
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json
+    orjson = None
 from datetime import datetime
 from typing import Dict, Any
 
@@ -26,50 +30,91 @@ class Config:
                 "save_directory": "experiment_data",
                 "auto_save": True,
                 "plot_update_interval": 100,  # milliseconds
-                "sensor_source": "auto"  # auto | simple_fixed | free_sphere
+                "sensor_source": "auto",  # auto | simple_fixed | free_sphere
+                "live_format": "csv",  # csv | arrow (Arrow IPC / Feather, needs pyarrow)
+                "output_format": "csv"  # csv | parquet | feather: saves without a file name (binary ones need pyarrow)
             }
         }
         self.config = self.load_config()
+        # Unsaved changes, and nesting depth of `with config:` blocks that defer saving
+        self._dirty = False
+        self._batch_depth = 0
+
+    def __enter__(self) -> "Config":
+        """Batch set() calls: the file is written once when the outermost block exits."""
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create with defaults."""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                if orjson is not None:
+                    with open(self.config_file, 'rb') as f:
+                        config = orjson.loads(f.read())
+                else:
+                    with open(self.config_file, 'r') as f:
+                        config = json.load(f)
                 # Merge with defaults to ensure all keys exist
                 return self._merge_config(self.default_config, config)
-            except (json.JSONDecodeError, FileNotFoundError):
+            except (ValueError, FileNotFoundError):  # JSONDecodeError and orjson.JSONDecodeError are ValueErrors
                 pass
-        return self.default_config.copy()
+        # Fresh section dicts, so set() never writes into default_config
+        return self._merge_config(self.default_config, {})
     
+    def flush(self) -> None:
+        """Save the configuration if set() changed it since the last save."""
+        if self._dirty:
+            self.save_config()
+
     def save_config(self) -> None:
         """Save current configuration to file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        self._dirty = False
+        if orjson is not None:
+            with open(self.config_file, 'wb') as f:
+                f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.config_file, 'w') as f:
+                json.dump(self.config, f, indent=2)
     
     def _merge_config(self, default: Dict, loaded: Dict) -> Dict:
-        """Recursively merge loaded config with defaults."""
-        result = default.copy()
-        for key, value in loaded.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_config(result[key], value)
+        """Merge loaded config over the defaults, section by section (the schema is one level of sections)."""
+        result = {}
+        for section, values in default.items():
+            user = loaded.get(section, {})
+            if isinstance(values, dict) and isinstance(user, dict):
+                result[section] = {**values, **user}
             else:
-                result[key] = value
+                result[section] = loaded.get(section, values)
+        # Keep sections the defaults don't know about
+        for section, values in loaded.items():
+            result.setdefault(section, values)
         return result
     
     def get(self, section: str, key: str = None) -> Any:
         """Get configuration value."""
-        if key is None:
-            return self.config.get(section, {})
-        return self.config.get(section, {}).get(key)
+        # Direct indexing for the common case of an existing key; missing ones fall back as before
+        try:
+            values = self.config[section]
+            return values if key is None else values[key]
+        except KeyError:
+            return {} if key is None else None
     
     def set(self, section: str, key: str, value: Any) -> None:
         """Set configuration value."""
-        if section not in self.config:
-            self.config[section] = {}
-        self.config[section][key] = value
-        self.save_config()
+        values = self.config.setdefault(section, {})
+        old = values.get(key, self)  # self: sentinel for a missing key
+        if old == value and type(old) is type(value):
+            return
+        values[key] = value
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.save_config()
     
     def get_experiment_params(self) -> Dict[str, Any]:
         """Get experiment parameters."""
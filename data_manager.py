@@ -1,36 +1,137 @@
-import pandas as pd
+from __future__ import annotations
+
+import importlib.util
+import sys
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from collections import deque
 import csv
+import io
+import queue
 import shutil
+import threading
+import time
+
+import fast_kernels
+
+
+def _lazy_import(name: str):
+    """Return module `name`, deferring its actual import until an attribute is first used."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# pandas takes a few hundred ms to import; nothing needs it until an experiment starts or data is loaded.
+pd = _lazy_import("pandas")
+# pyarrow is optional: Arrow/Parquet files and the multi-threaded CSV reader
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Fixed schema of the live file, in column order (avoid dynamic headers mid-run)
+LIVE_FIELDS = [
+    "timestamp",
+    "is_experiment",
+    "time",
+    "force_x",
+    "force_z",
+    "fixed_x",
+    "fixed_z",
+    "fx",
+    "fz",
+    "raw",
+    "message",
+]
+_LIVE_STRING_FIELDS = ("raw", "message")
+# Columns copied verbatim from the sample (timestamp and is_experiment are normalized first)
+_LIVE_VALUE_FIELDS = tuple(LIVE_FIELDS[2:])
+
 
 class DataManager:
     """Manages experiment data collection, storage, and analysis."""
     
-    def __init__(self, save_directory: str = "experiment_data", plot_max_points: int = 5000, auto_save: bool = True):
+    # Rows buffered per Arrow record batch in "arrow" live format
+    ARROW_BATCH_ROWS = 4096
+    # Write buffer of the live CSV file
+    LIVE_BUFFER_BYTES = 1 << 20
+    # Rows that may wait for the writer thread before new ones are dropped, and rows written per batch
+    WRITE_QUEUE_ROWS = 8192
+    WRITE_BATCH_ROWS = 512
+    # Longest a save or stop waits on the writer thread before giving up on it
+    WRITER_TIMEOUT_S = 5.0
+
+    def __init__(self, save_directory: str = "experiment_data", plot_max_points: int = 5000, auto_save: bool = True,
+                 live_format: str = "csv", output_format: str = "csv"):
         self.save_directory = save_directory
         self.plot_max_points = max(100, int(plot_max_points))
         self.auto_save = auto_save
+        # "csv" (default) or "arrow": Arrow IPC file (Feather v2), written in column batches; needs pyarrow
+        if live_format == "arrow" and not _HAS_PYARROW:
+            print("pyarrow is not installed; streaming experiment data to CSV instead")
+            live_format = "csv"
+        self.live_format = live_format
+        # Format of saves made without a file name: "csv" (default), "parquet" (Snappy) or "feather" (LZ4)
+        if output_format in ("parquet", "feather") and not _HAS_PYARROW:
+            print(f"pyarrow is not installed; saving experiment data as CSV instead of {output_format}")
+            output_format = "csv"
+        self.output_format = output_format
 
-        self.current_data = pd.DataFrame()
+        # Created on experiment start / load so that constructing the manager doesn't import pandas.
+        # While acquiring it is rebuilt from the plot buffers only when read (see current_data).
+        self._current_data: Optional[pd.DataFrame] = None
+        self._current_data_stale = False
+        # True while current_data is a loaded file, which can be longer than the plot buffers
+        self._current_data_loaded = False
         self.experiment_start_time: Optional[datetime] = None
         # For long experiments, keep plotting data bounded and stream full data to CSV.
         self.experiment_data = []
         self.is_experiment_running = False
 
-        self._plot_time = deque(maxlen=self.plot_max_points)
-        self._plot_fx = deque(maxlen=self.plot_max_points)
-        self._plot_fz = deque(maxlen=self.plot_max_points)
-        self._plot_timestamp = deque(maxlen=self.plot_max_points)
+        # Plot buffers: fixed-size float32 rings, each sample written twice (at i and i + capacity)
+        # so the newest window is always one contiguous slice that can be handed out without copying.
+        self._plot_capacity = self.plot_max_points
+        self._plot_time = np.empty(2 * self._plot_capacity, dtype=np.float32)
+        self._plot_fx = np.empty(2 * self._plot_capacity, dtype=np.float32)
+        self._plot_fz = np.empty(2 * self._plot_capacity, dtype=np.float32)
+        self._plot_head = 0
+        self._plot_count = 0
+        self._n_points = 0
+        self._plot_timestamp = deque(maxlen=self._plot_capacity)
+        # Running [min, max] of time, force_x and force_z since the buffers were last reset;
+        # a series has data once its min <= max
+        self._plot_extents = [[np.inf, -np.inf], [np.inf, -np.inf], [np.inf, -np.inf]]
 
-        self._live_csv_path: Optional[str] = None
+        self._live_path: Optional[str] = None
+        # True while _live_path is still the run's own experiment_* file, not one the user saved under a name
+        self._live_path_is_run_file = False
         self._csv_file = None
-        self._csv_writer: Optional[csv.DictWriter] = None
+        self._csv_writer = None
+        self._arrow_sink = None
+        self._arrow_writer = None
+        self._arrow_schema = None
+        self._arrow_columns: List[list] = []
         self._rows_written = 0
-        self._flush_every = 200
+        # Rows go to the live file on a writer thread so a slow disk never stalls acquisition
+        self._write_q: queue.Queue = queue.Queue(maxsize=self.WRITE_QUEUE_ROWS)
+        self._writer_thread: Optional[threading.Thread] = None
+        # Serializes stopping the writer with flush requests (a save runs off the Tk thread)
+        self._writer_lock = threading.Lock()
+        # Held while the live file is opened or closed: the UI closes it on its I/O worker (finish_live_file),
+        # possibly while the next run is already starting. _run_id tells the runs apart.
+        self._live_lock = threading.RLock()
+        self._run_id = 0
+        self._rows_dropped = 0
+        # Samples without a timestamp get time.monotonic_ns() (cheap int); it is turned into wall-clock
+        # time relative to this anchor only when written or read (see _wall_time/_wall_times)
+        self._t0_wall = datetime.now()
+        self._t0_mono = time.monotonic_ns()
 
         # Firmware time often keeps counting across experiments; normalize to elapsed time.
         self._device_time_zero: Optional[float] = None
@@ -46,61 +147,216 @@ class DataManager:
         self.is_experiment_running = True
 
         # Reset plotting buffers
-        self._plot_time.clear()
-        self._plot_fx.clear()
-        self._plot_fz.clear()
-        self._plot_timestamp.clear()
+        self._reset_plot_buffers()
         self.current_data = pd.DataFrame()
 
         # Reset time normalization
         self._device_time_zero = None
         self._last_elapsed_time_s = 0.0
 
-        # Create a live CSV file immediately so long runs don't depend on RAM
+        # Create a live file immediately so long runs don't depend on RAM
         timestamp = self.experiment_start_time.strftime("%Y%m%d_%H%M%S")
-        self._live_csv_path = os.path.join(self.save_directory, f"experiment_{timestamp}.csv")
-        self._open_live_csv(self._live_csv_path)
+        extension = ".arrow" if self.live_format == "arrow" else ".csv"
+        with self._live_lock:
+            # Waits only if the previous run's file is still being closed on a stalled disk
+            self._run_id += 1
+            self._live_path = os.path.join(self.save_directory, f"experiment_{timestamp}{extension}")
+            self._live_path_is_run_file = True
+            self._open_live_file(self._live_path)
+        self._t0_wall = datetime.now()
+        self._t0_mono = time.monotonic_ns()
         print(f"Started experiment data collection at {self.experiment_start_time}")
     
     def stop_experiment(self):
         """Stop experiment data collection."""
-        self.is_experiment_running = False
-        self._close_live_csv()
-        # Live CSV is already written during acquisition; keep behavior of "auto-save".
-        if self.auto_save and self._live_csv_path and os.path.exists(self._live_csv_path):
-            print(f"Experiment data saved to: {self._live_csv_path}")
-        print("Stopped experiment data collection")
+        self.finish_live_file(self.stop_acquisition())
 
+    def stop_acquisition(self) -> int:
+        """Stop accepting samples, leaving the live file open; returns the run to pass to finish_live_file()."""
+        self.is_experiment_running = False
         # Reset elapsed time so the next experiment starts at 0
         self._device_time_zero = None
         self._last_elapsed_time_s = 0.0
+        return self._run_id
+
+    def finish_live_file(self, run_id: int) -> Optional[str]:
+        """Flush and close the live file of run `run_id`; returns its path, or None if a newer run took over.
+
+        Waits on the writer thread (up to WRITER_TIMEOUT_S on a stalled disk), so the UI runs it on its I/O worker.
+        """
+        with self._live_lock:
+            if run_id != self._run_id:
+                # start_experiment already closed it before opening the next run's file
+                return None
+            self._close_live_file()
+            # Live file is already written during acquisition; keep behavior of "auto-save".
+            if self.auto_save and self._live_path and os.path.exists(self._live_path):
+                print(f"Experiment data saved to: {self._live_path}")
+            print("Stopped experiment data collection")
+            return self._live_path
 
     def get_last_elapsed_time(self) -> float:
         """Return last known elapsed experiment time (seconds)."""
         return float(self._last_elapsed_time_s)
 
-    def _open_live_csv(self, filepath: str):
-        # Fixed schema for stability (avoid dynamic headers mid-run)
-        fieldnames = [
-            "timestamp",
-            "is_experiment",
-            "time",
-            "force_x",
-            "force_z",
-            "fixed_x",
-            "fixed_z",
-            "fx",
-            "fz",
-            "raw",
-            "message",
-        ]
-        self._close_live_csv()
-        self._csv_file = open(filepath, "w", newline="", encoding="utf-8")
-        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=fieldnames)
-        self._csv_writer.writeheader()
+    def _open_live_file(self, filepath: str):
+        """Open the live file for a new experiment in the configured format."""
+        self._close_live_file()
+        if self.live_format == "arrow":
+            self._open_live_arrow(filepath)
+        else:
+            # Large buffer: rows reach the disk in ~1 MiB writes; flushed on stop and before a save copies the file
+            self._csv_file = open(filepath, "w", newline="", encoding="utf-8", buffering=self.LIVE_BUFFER_BYTES)
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(LIVE_FIELDS)
         self._rows_written = 0
+        self._rows_dropped = 0
+        # A fresh queue per writer, so a writer that failed to stop can't consume the new run's rows
+        self._write_q = queue.Queue(maxsize=self.WRITE_QUEUE_ROWS)
+        self._writer_thread = threading.Thread(target=self._writer_loop, args=(self._write_q,),
+                                               name="live-file-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _writer_loop(self, write_q: queue.Queue):
+        """Writer thread: write queued rows in batches until the None sentinel arrives."""
+        while True:
+            batch = [write_q.get()]
+            while len(batch) < self.WRITE_BATCH_ROWS:
+                try:
+                    batch.append(write_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = []
+            for item in batch:
+                if item is None or isinstance(item, threading.Event):
+                    # Sentinel (stop) or flush request: write what came before it first
+                    self._write_rows(rows)
+                    rows = []
+                    if item is None:
+                        return
+                    self._flush_live_csv(item)
+                else:
+                    rows.append(item)
+            self._write_rows(rows)
+
+    def _flush_live_csv(self, request: threading.Event):
+        """Flush the live CSV for a flush request, recording the file size it covers (writer thread only)."""
+        request.offset = None
+        try:
+            if self._csv_file:
+                self._csv_file.flush()
+                request.offset = self._csv_file.tell()
+        except Exception as e:
+            print(f"Error flushing experiment data: {e}")
+        finally:
+            # Always answer, or the saving thread would wait for nothing
+            request.set()
+
+    def _request_flush(self) -> Optional[int]:
+        """Have the writer push queued and buffered rows out; returns the live file size that covers them.
 
-    def _close_live_csv(self):
+        None if there is no running writer. Raises RuntimeError if the writer does not answer in time.
+        """
+        with self._writer_lock:
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                return None
+            flushed = threading.Event()
+            try:
+                self._write_q.put(flushed, timeout=self.WRITER_TIMEOUT_S)
+            except queue.Full:
+                raise RuntimeError("The live file writer is not keeping up; try saving again")
+        if not flushed.wait(self.WRITER_TIMEOUT_S):
+            raise RuntimeError("The live file writer is not responding; try saving again")
+        return flushed.offset
+
+    def _write_rows(self, rows: List[tuple]):
+        """Write rows to the live file (writer thread only)."""
+        if not rows:
+            return
+        try:
+            if self._csv_writer:
+                wall_time = self._wall_time
+                self._csv_writer.writerows((wall_time(row[0]),) + row[1:] for row in rows)
+            else:
+                for row in rows:
+                    self._write_arrow_row(row)
+        except Exception as e:
+            # Avoid killing acquisition if disk write fails
+            print(f"Error writing experiment data: {e}")
+
+    def _wall_time(self, ts: Any) -> Any:
+        """Wall-clock datetime for a sample timestamp; monotonic_ns ints are converted, anything else is kept."""
+        if type(ts) is int:
+            return self._t0_wall + timedelta(microseconds=(ts - self._t0_mono) // 1000)
+        return ts
+
+    def _wall_times(self, values: List[Any]):
+        """Vectorized _wall_time: a datetime64[us] array if every value is a monotonic_ns int, else a list."""
+        if values and all(type(v) is int for v in values):
+            offsets = (np.asarray(values, dtype=np.int64) - self._t0_mono) // 1000
+            return np.datetime64(self._t0_wall, "us") + offsets.astype("timedelta64[us]")
+        return [self._wall_time(v) for v in values]
+
+    def _stop_writer(self):
+        """Let the writer thread finish the queued rows and exit."""
+        with self._writer_lock:
+            writer, self._writer_thread = self._writer_thread, None
+        if writer is not None:
+            try:
+                if writer.is_alive():
+                    self._write_q.put(None, timeout=self.WRITER_TIMEOUT_S)
+            except queue.Full:
+                pass
+            writer.join(self.WRITER_TIMEOUT_S)
+            if writer.is_alive():
+                print("Warning: the live file writer did not finish; the last rows may be missing")
+            if self._rows_dropped:
+                print(f"Warning: {self._rows_dropped} rows were dropped because the disk could not keep up")
+
+    def _open_live_arrow(self, filepath: str):
+        """Open an Arrow IPC file writer; rows are collected column-wise and written ARROW_BATCH_ROWS at a time."""
+        import pyarrow as pa
+
+        self._arrow_schema = pa.schema(
+            [("timestamp", pa.timestamp("us")), ("is_experiment", pa.bool_())]
+            + [(name, pa.float64()) for name in LIVE_FIELDS[2:] if name not in _LIVE_STRING_FIELDS]
+            + [(name, pa.string()) for name in _LIVE_STRING_FIELDS]
+        )
+        self._arrow_sink = pa.OSFile(filepath, "wb")
+        self._arrow_writer = pa.ipc.new_file(self._arrow_sink, self._arrow_schema)
+        self._arrow_columns = [[] for _ in LIVE_FIELDS]
+
+    def _write_arrow_row(self, row: tuple):
+        """Buffer one row (in LIVE_FIELDS order) for the Arrow writer, flushing a record batch when full."""
+        for column, value in zip(self._arrow_columns, row):
+            column.append(value)
+        if len(self._arrow_columns[0]) >= self.ARROW_BATCH_ROWS:
+            self._flush_arrow_batch()
+
+    def _flush_arrow_batch(self):
+        """Write the buffered rows as one Arrow record batch."""
+        if not self._arrow_columns or not self._arrow_columns[0]:
+            return
+        import pyarrow as pa
+
+        columns = dict(zip(LIVE_FIELDS, self._arrow_columns))
+        columns["timestamp"] = self._wall_times(columns["timestamp"])
+        try:
+            batch = pa.RecordBatch.from_pydict(columns, schema=self._arrow_schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # A reading that isn't a number (e.g. a garbled line); coerce the numeric columns and retry
+            for name in LIVE_FIELDS:
+                if pa.types.is_floating(self._arrow_schema.field(name).type):
+                    columns[name] = [self._to_float(v) for v in columns[name]]
+            batch = pa.RecordBatch.from_pydict(columns, schema=self._arrow_schema)
+        self._arrow_writer.write_batch(batch)
+        for column in self._arrow_columns:
+            column.clear()
+
+    def _close_live_file(self):
+        """Flush and close the live file, whichever format it is."""
+        self._stop_writer()
         try:
             if self._csv_file:
                 try:
@@ -108,44 +364,55 @@ class DataManager:
                 except Exception:
                     pass
                 self._csv_file.close()
+            if self._arrow_writer is not None:
+                try:
+                    self._flush_arrow_batch()
+                except Exception as e:
+                    print(f"Error writing experiment data: {e}")
+                self._arrow_writer.close()
+                self._arrow_sink.close()
         finally:
             self._csv_file = None
             self._csv_writer = None
+            self._arrow_writer = None
+            self._arrow_sink = None
+            self._arrow_columns = []
     
     def add_data_point(self, data: Dict[str, Any]):
         """Add a data point to the current experiment."""
+        self.add_data_points([data])
+
+    def add_data_points(self, batch: List[Dict[str, Any]]):
+        """Add a batch of data points; the DataFrame view is rebuilt lazily (see current_data)."""
         if not self.is_experiment_running:
             return
-            
-        # Add timestamp if not present
+
+        appended = False
+        for data in batch:
+            appended = self._append_data_point(data) or appended
+
+        if appended:
+            self._current_data_stale = True
+
+    def _append_data_point(self, data: Dict[str, Any]) -> bool:
+        """Stream one sample to the live file and the plot buffers; return True if it was added to the plot buffers."""
+        # Add timestamp if not present (monotonic ns; converted to wall-clock time off the hot path)
         if "timestamp" not in data:
-            data["timestamp"] = datetime.now()
-
-        # Stream to CSV (full-resolution storage)
-        if self._csv_writer:
-            row = {
-                "timestamp": data.get("timestamp"),
-                "is_experiment": bool(data.get("is_experiment", False)),
-                "time": data.get("time"),
-                "force_x": data.get("force_x"),
-                "force_z": data.get("force_z"),
-                "fixed_x": data.get("fixed_x"),
-                "fixed_z": data.get("fixed_z"),
-                "fx": data.get("fx"),
-                "fz": data.get("fz"),
-                "raw": data.get("raw"),
-                "message": data.get("message"),
-            }
+            data["timestamp"] = time.monotonic_ns()
+
+        # Stream to the live file (full-resolution storage)
+        if self._csv_writer or self._arrow_writer is not None:
+            # Row tuple in LIVE_FIELDS order; missing keys become None (empty CSV cells)
+            get = data.get
+            row = (data["timestamp"], bool(get("is_experiment", False))) + tuple(map(get, _LIVE_VALUE_FIELDS))
             try:
-                self._csv_writer.writerow(row)
+                self._write_q.put_nowait(row)
                 self._rows_written += 1
-                if self._csv_file and (self._rows_written % self._flush_every) == 0:
-                    self._csv_file.flush()
-            except Exception:
-                # Avoid killing acquisition if disk write fails
-                pass
+            except queue.Full:
+                # Writer can't keep up; drop rather than block acquisition (reported on stop)
+                self._rows_dropped += 1
         
-        # Update current dataframe for real-time plotting
+        # Update plot buffers for real-time plotting
         if data.get("is_experiment", False):
             device_t = data.get("time", None)
             if device_t is None:
@@ -165,94 +432,332 @@ class DataManager:
 
             self._last_elapsed_time_s = float(elapsed_t)
 
-            t = float(elapsed_t)
-            fx = data.get("force_x", np.nan)
-            fz = data.get("force_z", np.nan)
-            ts = data.get("timestamp")
-
-            self._plot_time.append(t)
-            self._plot_fx.append(fx)
-            self._plot_fz.append(fz)
-            self._plot_timestamp.append(ts)
-
-            # Materialize a small DataFrame view for plotting/analysis
-            self.current_data = pd.DataFrame(
-                {
-                    "time": list(self._plot_time),
-                    "force_x": list(self._plot_fx),
-                    "force_z": list(self._plot_fz),
-                    "timestamp": list(self._plot_timestamp),
-                }
+            self._push_plot_sample(
+                float(elapsed_t),
+                self._to_float(data.get("force_x")),
+                self._to_float(data.get("force_z")),
+                data.get("timestamp"),
             )
+            return True
+        return False
+
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        """Convert a reading to float, mapping missing/invalid values to NaN."""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def _reset_plot_buffers(self):
+        """Empty the plot ring buffers."""
+        self._plot_head = 0
+        self._plot_count = 0
+        self._n_points = 0
+        # Whatever the buffers held is gone, including a loaded file (set_current_data sets it again)
+        self._current_data_loaded = False
+        self._plot_timestamp.clear()
+        for extent in self._plot_extents:
+            extent[0], extent[1] = np.inf, -np.inf
+
+    def _push_plot_sample(self, t: float, fx: float, fz: float, ts: Any):
+        """Write one sample into the plot ring buffers."""
+        i = self._plot_head
+        j = i + self._plot_capacity
+        self._plot_time[i] = self._plot_time[j] = t
+        self._plot_fx[i] = self._plot_fx[j] = fx
+        self._plot_fz[i] = self._plot_fz[j] = fz
+        self._plot_timestamp.append(ts)
+        # NaN compares False, so missing readings never widen the extents (has_fx/has_fz rely on this)
+        for extent, v in zip(self._plot_extents, (t, fx, fz)):
+            if v < extent[0]:
+                extent[0] = v
+            if v > extent[1]:
+                extent[1] = v
+        self._plot_head = (i + 1) % self._plot_capacity
+        if self._plot_count < self._plot_capacity:
+            self._plot_count += 1
+        self._n_points += 1
+
+    @property
+    def has_experiment_data(self) -> bool:
+        """True if the current experiment has rows to save (streamed to the live CSV or held in memory)."""
+        return self._rows_written > 0 or bool(self.experiment_data)
+
+    @property
+    def n_points(self) -> int:
+        """Number of samples added to the plot buffers since they were last reset (not capped)."""
+        return self._n_points
+
+    @property
+    def has_fx(self) -> bool:
+        """True if the plot buffers have received a force X reading."""
+        lo, hi = self._plot_extents[1]
+        return lo <= hi
+
+    @property
+    def has_fz(self) -> bool:
+        """True if the plot buffers have received a force Z reading."""
+        lo, hi = self._plot_extents[2]
+        return lo <= hi
+
+    def get_plot_extents(self) -> Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]:
+        """Return ((t_min, t_max), (fx_min, fx_max), (fz_min, fz_max)) seen since the plot buffers were reset.
+
+        Values are (inf, -inf) for a series with no reading yet.
+        """
+        return tuple(tuple(extent) for extent in self._plot_extents)
+
+    def get_plot_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (time, force_x, force_z) for the plot window, oldest first.
+
+        The arrays are float32 views into the ring buffers (no copy); they are
+        only valid until the next data point is added.
+        """
+        end = self._plot_head + (self._plot_capacity if self._plot_count == self._plot_capacity else 0)
+        start = end - self._plot_count
+        return self._plot_time[start:end], self._plot_fx[start:end], self._plot_fz[start:end]
+
+    def set_current_data(self, df: pd.DataFrame):
+        """Replace the current data with a loaded DataFrame and fill the plot buffers from it."""
+        self.current_data = df
+        self._reset_plot_buffers()
+        self._current_data_loaded = True
+        if "time" not in df.columns:
+            return
+        tail = df.tail(self._plot_capacity)
+        n = len(tail)
+        cap = self._plot_capacity
+        # Convert each column straight into its ring buffer, then mirror it (see _push_plot_sample)
+        for buf, col in ((self._plot_time, "time"), (self._plot_fx, "force_x"), (self._plot_fz, "force_z")):
+            if col in tail.columns:
+                buf[:n] = pd.to_numeric(tail[col], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan)
+            else:
+                buf[:n] = np.nan
+            buf[cap:cap + n] = buf[:n]
+        self._plot_head = n % cap
+        self._plot_count = n
+        self._n_points = n
+        self._plot_timestamp.extend(tail["timestamp"] if "timestamp" in tail.columns else [None] * n)
+
+        # Extents (and so has_fx/has_fz) come from views of the filled buffers (no copies)
+        for extent, values in zip(self._plot_extents, self.get_plot_arrays()):
+            lo, hi = fast_kernels.minmax(values)
+            if lo == lo:
+                extent[0], extent[1] = float(lo), float(hi)
+
+    @property
+    def current_data(self) -> Optional[pd.DataFrame]:
+        """Current data as a DataFrame, built from the plot buffers on first read after new samples."""
+        if self._current_data_stale:
+            self._rebuild_current_data()
+        return self._current_data
+
+    @current_data.setter
+    def current_data(self, df: Optional[pd.DataFrame]):
+        self._current_data = df
+        self._current_data_stale = False
+
+    def _rebuild_current_data(self):
+        """Materialize a small DataFrame view of the plot buffers for analysis (in float64)."""
+        t, fx, fz = self.get_plot_arrays()
+        self.current_data = pd.DataFrame(
+            {
+                "time": t.astype(np.float64),
+                "force_x": fx.astype(np.float64),
+                "force_z": fz.astype(np.float64),
+                "timestamp": self._wall_times(list(self._plot_timestamp)),
+            }
+        )
     
     def get_current_data(self) -> pd.DataFrame:
         """Get current experiment data as DataFrame."""
+        if self.current_data is None:
+            return pd.DataFrame()
         return self.current_data.copy()
     
     def get_experiment_progress(self, total_duration: float) -> float:
         """Get experiment progress as percentage (0-100)."""
-        if not self.is_experiment_running or self.current_data.empty:
+        if not self.is_experiment_running or self._n_points == 0:
             return 0.0
         
-        current_time = self.current_data["time"].max() if not self.current_data["time"].isna().all() else 0
+        # Running maximum of the elapsed time; avoids building the DataFrame on every progress tick
+        current_time = self._plot_extents[0][1]
         progress = min((current_time / total_duration) * 100, 100) if total_duration > 0 else 0
         return progress
     
     def save_experiment_data(self, filename: Optional[str] = None) -> str:
-        """Save experiment data to CSV file."""
-        # Data is streamed to the live CSV during acquisition.
-        if not self._live_csv_path or not os.path.exists(self._live_csv_path):
+        """Save experiment data to a file (CSV unless the name ends in .arrow/.feather or .parquet)."""
+        # Data is streamed to the live file during acquisition.
+        if not self._live_path or not os.path.exists(self._live_path):
             # Back-compat: if someone filled experiment_data in-memory, fall back.
             if not self.experiment_data:
                 return ""
             if filename is None:
                 timestamp = self.experiment_start_time.strftime("%Y%m%d_%H%M%S") if self.experiment_start_time else datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"experiment_{timestamp}.csv"
+                filename = f"experiment_{timestamp}.{self.output_format}"
             filepath = os.path.join(self.save_directory, filename)
             df = pd.DataFrame(self.experiment_data)
-            df.to_csv(filepath, index=False)
+            self._write_file(df, filepath)
             print(f"Experiment data saved to: {filepath}")
             return filepath
 
         if filename is None:
-            return self._live_csv_path
+            if self._file_format(self._live_path) == self._file_format(f".{self.output_format}"):
+                return self._live_path
+            # The live file is in another format: save a converted copy next to it in output_format
+            base = os.path.splitext(os.path.basename(self._live_path))[0]
+            filename = f"{base}.{self.output_format}"
 
         dest_path = os.path.join(self.save_directory, filename)
-        if os.path.abspath(dest_path) == os.path.abspath(self._live_csv_path):
+        if os.path.abspath(dest_path) == os.path.abspath(self._live_path):
             return dest_path
+        if self._arrow_writer is not None:
+            raise RuntimeError("Stop the experiment before saving; the Arrow live file is finalized on stop")
+        # Saving mid-run: the writer keeps appending, so only the part it flushed is complete rows
+        live_size = self._request_flush()
 
-        shutil.copyfile(self._live_csv_path, dest_path)
+        if self._file_format(self._live_path) == self._file_format(dest_path):
+            if (not self.is_experiment_running and not self.auto_save and self._live_path_is_run_file
+                    and self._same_directory(dest_path, self._live_path)):
+                # Finished scratch file (not kept as an auto-save), same directory: a rename instead of a copy.
+                # Only once: after this _live_path is the user's file, and later saves copy it.
+                os.replace(self._live_path, dest_path)
+                self._live_path = dest_path
+                self._live_path_is_run_file = False
+            elif live_size is not None:
+                self._copy_prefix(self._live_path, dest_path, live_size)
+            else:
+                shutil.copyfile(self._live_path, dest_path)
+        else:
+            # Mid-run, read only the rows the writer flushed (same as the copy above)
+            self._write_file(self._read_file(self._live_path, size=live_size), dest_path)
         print(f"Experiment data saved to: {dest_path}")
         return dest_path
     
+    @staticmethod
+    def _copy_prefix(src_path: str, dest_path: str, size: int):
+        """Copy the first `size` bytes of src_path to dest_path."""
+        with open(src_path, "rb") as src, open(dest_path, "wb") as dest:
+            while size > 0:
+                chunk = src.read(min(size, 1 << 20))
+                if not chunk:
+                    break
+                dest.write(chunk)
+                size -= len(chunk)
+
+    @staticmethod
+    def _same_directory(path_a: str, path_b: str) -> bool:
+        """True if both paths are in the same directory (so os.replace is a plain rename)."""
+        return os.path.dirname(os.path.abspath(path_a)) == os.path.dirname(os.path.abspath(path_b))
+
+    @staticmethod
+    def _file_format(path: str) -> str:
+        """Data file format from the extension: "arrow" (.arrow/.feather), "parquet" or "csv"."""
+        if path.endswith((".arrow", ".feather")):
+            return "arrow"
+        if path.endswith(".parquet"):
+            return "parquet"
+        return "csv"
+
+    @classmethod
+    def _read_file(cls, filepath: str, size: Optional[int] = None) -> pd.DataFrame:
+        """Read a data file in the format given by its extension, with the timestamp column parsed.
+
+        For a CSV, `size` limits the read to the first `size` bytes (a live file still being appended).
+        """
+        file_format = cls._file_format(filepath)
+        if file_format == "arrow":
+            df = pd.read_feather(filepath)
+        elif file_format == "parquet":
+            df = pd.read_parquet(filepath)
+        else:
+            source = filepath
+            if size is not None:
+                with open(filepath, "rb") as f:
+                    source = io.BytesIO(f.read(size))
+            if _HAS_PYARROW:
+                try:
+                    # Multi-threaded parser; also parses the timestamp column itself
+                    df = pd.read_csv(source, engine="pyarrow")
+                except Exception:
+                    # Rows it can't parse (e.g. a line cut short by a crash): the C parser is more lenient
+                    if size is not None:
+                        source.seek(0)
+                    df = pd.read_csv(source)
+            else:
+                df = pd.read_csv(source)
+        # Convert timestamp column if it exists
+        if "timestamp" in df.columns:
+            df["timestamp"] = pd.to_datetime(df["timestamp"])
+        return df
+
+    @classmethod
+    def _write_file(cls, df: pd.DataFrame, filepath: str):
+        """Write df in the format given by the extension (compressed for the binary formats)."""
+        file_format = cls._file_format(filepath)
+        if file_format == "arrow":
+            df.to_feather(filepath, compression="lz4")
+        elif file_format == "parquet":
+            df.to_parquet(filepath, compression="snappy", index=False)
+        else:
+            df.to_csv(filepath, index=False)
+
     def load_experiment_data(self, filepath: str) -> pd.DataFrame:
-        """Load experiment data from CSV file."""
+        """Load experiment data from a CSV, Arrow/Feather or Parquet file."""
         try:
-            df = pd.read_csv(filepath)
-            # Convert timestamp column if it exists
-            if "timestamp" in df.columns:
-                df["timestamp"] = pd.to_datetime(df["timestamp"])
-            return df
+            return self._read_file(filepath)
         except Exception as e:
             print(f"Error loading data from {filepath}: {e}")
             return pd.DataFrame()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get basic statistics of current experiment data."""
-        if self.current_data.empty:
+        if self._current_data_loaded:
+            return self._dataframe_statistics(self.current_data)
+
+        # Live data: aggregate the plot buffer views directly, without building the DataFrame
+        t, fx, fz = self.get_plot_arrays()
+        if len(t) == 0:
+            return {}
+
+        stats = {}
+
+        # Time statistics
+        t_lo, t_hi = fast_kernels.minmax(t)
+        if t_lo == t_lo:
+            stats["duration"] = float(t_hi)
+            stats["data_points"] = len(t)
+
+        # Force statistics (float64 accumulation; the buffers are float32)
+        for force_col, values in (("force_x", fx), ("force_z", fz)):
+            force_data = values[~np.isnan(values)].astype(np.float64)
+            if force_data.size:
+                stats[f"{force_col}_mean"] = float(force_data.mean())
+                # Sample standard deviation, as pandas computes it
+                stats[f"{force_col}_std"] = float(force_data.std(ddof=1)) if force_data.size > 1 else float("nan")
+                stats[f"{force_col}_min"] = float(force_data.min())
+                stats[f"{force_col}_max"] = float(force_data.max())
+
+        return stats
+
+    @staticmethod
+    def _dataframe_statistics(df: pd.DataFrame) -> Dict[str, Any]:
+        """Statistics of a loaded DataFrame (same keys as get_statistics)."""
+        if df is None or df.empty:
             return {}
         
         stats = {}
         
         # Time statistics
-        if not self.current_data["time"].isna().all():
-            stats["duration"] = self.current_data["time"].max()
-            stats["data_points"] = len(self.current_data)
+        if "time" in df.columns and not df["time"].isna().all():
+            stats["duration"] = df["time"].max()
+            stats["data_points"] = len(df)
         
         # Force statistics
         for force_col in ["force_x", "force_z"]:
-            if force_col in self.current_data.columns and not self.current_data[force_col].isna().all():
-                force_data = self.current_data[force_col].dropna()
+            if force_col in df.columns and not df[force_col].isna().all():
+                force_data = df[force_col].dropna()
                 stats[f"{force_col}_mean"] = force_data.mean()
                 stats[f"{force_col}_std"] = force_data.std()
                 stats[f"{force_col}_min"] = force_data.min()
@@ -265,21 +770,24 @@ class DataManager:
         self.current_data = pd.DataFrame()
         self.experiment_data = []
         self.is_experiment_running = False
-        self._plot_time.clear()
-        self._plot_fx.clear()
-        self._plot_fz.clear()
-        self._plot_timestamp.clear()
-        self._close_live_csv()
-        self._live_csv_path = None
+        self._reset_plot_buffers()
+        with self._live_lock:
+            self._close_live_file()
+            self._live_path = None
         self._rows_written = 0
     
-    def export_summary_report(self, filepath: str = None) -> str:
-        """Export a summary report of the experiment."""
+    def export_summary_report(self, filepath: str = None, stats: Optional[Dict[str, Any]] = None) -> str:
+        """Export a summary report of the experiment.
+
+        ``stats`` may be a snapshot from get_statistics() taken by the caller,
+        e.g. when the report is written from a worker thread.
+        """
         if filepath is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = os.path.join(self.save_directory, f"experiment_summary_{timestamp}.txt")
         
-        stats = self.get_statistics()
+        if stats is None:
+            stats = self.get_statistics()
         
         with open(filepath, 'w') as f:
             f.write("Tribology Experiment Summary Report\n")
@@ -0,0 +1,147 @@
+"""
+Numeric kernels for the real-time plot (decimation and data extents).
+
+The backend is picked at import: the Cython build (_fast_kernels_cy.pyx,
+compiled with `cythonize -i _fast_kernels_cy.pyx`) if present, else Numba if
+installed (compiled by warm_up() or on first use), else vectorized NumPy
+equivalents (per-bucket min/max replaces LTTB).
+"""
+
+import sys
+
+import numpy as np
+
+try:
+    import _fast_kernels_cy
+except ImportError:  # Cython build is optional
+    _fast_kernels_cy = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def _lttb_indices(t, y, n_out):
+    """Largest-Triangle-Three-Buckets: pick n_out indices that best preserve the shape of y(t).
+
+    The caller must ensure 3 <= n_out < len(t).
+    """
+    n = t.shape[0]
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # Average point of the next bucket
+        avg_start = int((i + 1) * every) + 1
+        avg_end = int((i + 2) * every) + 1
+        if avg_end > n:
+            avg_end = n
+        avg_t = 0.0
+        avg_y = 0.0
+        for k in range(avg_start, avg_end):
+            avg_t += t[k]
+            avg_y += y[k]
+        count = avg_end - avg_start
+        avg_t /= count
+        avg_y /= count
+
+        # Point of the current bucket forming the largest triangle with the previous pick and that average
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        ta = t[a]
+        ya = y[a]
+        max_area = -1.0
+        chosen = start
+        for k in range(start, end):
+            area = abs((ta - avg_t) * (y[k] - ya) - (ta - t[k]) * (avg_y - ya))
+            if area > max_area:
+                max_area = area
+                chosen = k
+        out[i + 1] = chosen
+        a = chosen
+    return out
+
+
+def _minmax(y):
+    """Return (min, max) of y ignoring NaN; (nan, nan) if there is no finite value."""
+    lo = np.inf
+    hi = -np.inf
+    for v in y:
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+    if lo > hi:
+        return np.nan, np.nan
+    return lo, hi
+
+
+def _minmax_bucket_indices(t, y, n_out):
+    """Indices of the min and max of y in n_out // 2 equal buckets (fallback for LTTB; keeps spikes)."""
+    n = t.shape[0]
+    buckets = max(1, n_out // 2)
+    size = n // buckets
+    body = y[:buckets * size].reshape(buckets, size)
+    nan = np.isnan(body)
+    offsets = np.arange(buckets, dtype=np.int64) * size
+    lo = np.where(nan, np.inf, body).argmin(axis=1) + offsets
+    hi = np.where(nan, -np.inf, body).argmax(axis=1) + offsets
+    # Keep both picks of each bucket in time order, plus the last sample so the line reaches the end
+    idx = np.sort(np.concatenate((lo, hi, [n - 1])))
+    return idx
+
+
+def _minmax_np(y):
+    """NumPy version of _minmax."""
+    finite = y[~np.isnan(y)]
+    if finite.size == 0:
+        return np.nan, np.nan
+    return finite.min(), finite.max()
+
+
+def _lazy_jit(name, func, fallback, **options):
+    """Return a stand-in for module attribute `name` that compiles func with Numba on first call.
+
+    Compiling at import would add its cost to every startup. The stand-in
+    replaces itself with the compiled kernel, or with `fallback` if Numba
+    fails (e.g. no cache locator in a frozen build), so later calls pay nothing.
+    """
+    def first_call(*args):
+        try:
+            # A frozen build has no writable source tree for Numba's on-disk cache.
+            kernel = njit(cache=not getattr(sys, "frozen", False), **options)(func)
+            result = kernel(*args)
+        except Exception as e:
+            print(f"Numba unavailable for {name}, using NumPy: {e}")
+            kernel = fallback
+            result = kernel(*args)
+        globals()[name] = kernel
+        return result
+
+    return first_call
+
+
+def warm_up():
+    """Run both kernels once on a tiny array, so a lazily compiled backend is ready before the first plot.
+
+    Takes a while with Numba on a cold cache; call it off the GUI thread.
+    """
+    warm = np.arange(8, dtype=np.float32)
+    lttb_indices(warm, warm, 4)
+    minmax(warm)
+
+
+if _fast_kernels_cy is not None:
+    lttb_indices = _fast_kernels_cy.lttb_indices
+    minmax = _fast_kernels_cy.minmax
+elif njit is not None:
+    # fastmath is only safe for LTTB; minmax must keep IEEE NaN semantics.
+    lttb_indices = _lazy_jit("lttb_indices", _lttb_indices, _minmax_bucket_indices, fastmath=True)
+    minmax = _lazy_jit("minmax", _minmax, _minmax_np)
+else:
+    lttb_indices = _minmax_bucket_indices
+    minmax = _minmax_np
@@ -11,17 +11,8 @@ def fix_setuptools_issue():
     print("Fixing setuptools issues...")
     
     commands = [
-        # Force reinstall pip
-        [sys.executable, "-m", "pip", "install", "--force-reinstall", "pip"],
-        
-        # Force reinstall setuptools and wheel
-        [sys.executable, "-m", "pip", "install", "--force-reinstall", "setuptools", "wheel"],
-        
-        # Install build tools
-        [sys.executable, "-m", "pip", "install", "--upgrade", "build"],
-        
-        # Install packaging tools
-        [sys.executable, "-m", "pip", "install", "--upgrade", "packaging"],
+        # Force reinstall pip, setuptools and wheel and install the build/packaging tools in one pip run
+        [sys.executable, "-m", "pip", "install", "--force-reinstall", "pip", "setuptools", "wheel", "build", "packaging"],
     ]
     
     for cmd in commands:
@@ -48,28 +39,13 @@ def install_compatible_packages():
         "pandas>=2.1.0",
     ]
     
-    for package in packages:
-        try:
-            print(f"Installing {package}...")
-            subprocess.run([
-                sys.executable, "-m", "pip", "install", 
-                "--no-deps",  # Install without dependencies first
-                package
-            ], check=True)
-            print(f"✅ {package} installed")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install {package}: {e}")
-    
-    # Now install with dependencies
-    print("\nInstalling with dependencies...")
-    for package in packages:
-        try:
-            subprocess.run([
-                sys.executable, "-m", "pip", "install", 
-                package
-            ], check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Warning: {package} dependencies may have issues: {e}")
+    # A single pip run: one resolver pass picks mutually compatible versions of all packages
+    try:
+        print(f"Installing {', '.join(packages)}...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
+        print("✅ Packages installed")
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install packages: {e}")
 
 def test_imports():
     """Test if critical packages can be imported."""
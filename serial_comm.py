@@ -1,21 +1,53 @@
 import serial
+import math
 import threading
 import time
-import queue
-from typing import Optional, Callable, Dict, Any
+from collections import deque
+from typing import Optional, Callable, Dict, Any, Iterator
 import re
 
+# Fields of a data line, e.g. "Time:123.45,Fixed_X:1.23,Fixed_Z:4.56" (simple mode) or "...,Fx:1.23,Fz:4.56" (force mode)
+_FIELD_KEYS = {'Time': 'time', 'Fixed_X': 'fixed_x', 'Fixed_Z': 'fixed_z', 'Fx': 'fx', 'Fz': 'fz'}
+# Fixed commands, encoded once
+_CMD_START = b"3\n"  # Button press simulation
+_CMD_STOP = b"stop\n"
+
+# Keywords that make a line without readings a status message (matched against the lowercased line;
+# re.IGNORECASE is several times slower on lines that don't match)
+_RE_STATUS = re.compile(r'experiment|started|finished|pump|motor')
+
 class SerialCommunication:
     """Handles serial communication with the tribology experiment device."""
+
+    # Longest a read blocks waiting for data, so the reader notices stop_reading() promptly
+    READ_TIMEOUT_S = 0.05
+    # Driver receive buffer requested on Windows, so bursts aren't dropped between reads
+    RX_BUFFER_BYTES = 65536
+    # Samples waiting for drain(); older ones are dropped (and counted) once it is full
+    QUEUE_MAX_SAMPLES = 8192
+    # How long an enumerated port list is reused by get_available_ports()
+    PORTS_CACHE_S = 2.0
+    # How long a command waits for the writer thread to report the write; longer means the UART is
+    # still draining and the command counts as sent
+    COMMAND_TIMEOUT_S = 0.5
     
     def __init__(self):
         self.serial_port: Optional[serial.Serial] = None
         self.is_connected = False
         self.is_reading = False
         self.read_thread: Optional[threading.Thread] = None
-        # Bounded queue to avoid unbounded RAM usage if nobody consumes it.
-        self.data_queue = queue.Queue(maxsize=20000)
+        # Bounded to avoid unbounded RAM usage if nobody consumes it; when full the oldest sample is dropped.
+        # One producer (reader thread) and one consumer, so deque's atomic append/popleft need no lock.
+        self.data_queue: deque = deque(maxlen=self.QUEUE_MAX_SAMPLES)
+        # Samples dropped from data_queue unread since connect (written by the reader thread only)
+        self.dropped = 0
         self.data_callback: Optional[Callable] = None
+        # Outgoing (encoded command, done event) pairs, written by a writer thread so a draining UART
+        # never blocks the caller for long
+        self._send_queue: deque = deque()
+        self._send_ready = threading.Event()
+        self.write_thread: Optional[threading.Thread] = None
+        self._ports_cache: Optional[tuple] = None  # (monotonic time, ports)
         
     def connect(self, port: str, baudrate: int = 115200, timeout: float = 1.0) -> bool:
         """Connect to the serial port."""
@@ -23,12 +55,19 @@ class SerialCommunication:
             self.serial_port = serial.Serial(
                 port=port,
                 baudrate=baudrate,
-                timeout=timeout,
+                timeout=min(timeout, self.READ_TIMEOUT_S),
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
                 bytesize=serial.EIGHTBITS
             )
+            if hasattr(self.serial_port, "set_buffer_size"):  # Windows only
+                self.serial_port.set_buffer_size(rx_size=self.RX_BUFFER_BYTES)
+            # A new connection starts with an empty backlog and drop count
+            self.data_queue.clear()
+            self.dropped = 0
             self.is_connected = True
+            self.write_thread = threading.Thread(target=self._write_data, daemon=True)
+            self.write_thread.start()
             self.start_reading()
             return True
         except serial.SerialException as e:
@@ -38,6 +77,12 @@ class SerialCommunication:
     def disconnect(self):
         """Disconnect from the serial port."""
         self.stop_reading()
+        # Let the writer send what is still queued (e.g. a final "stop") before the port closes
+        self.is_connected = False
+        if self.write_thread:
+            self._send_ready.set()
+            self.write_thread.join(timeout=2.0)
+            self.write_thread = None
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
         self.is_connected = False
@@ -57,53 +102,74 @@ class SerialCommunication:
     
     def _read_data(self):
         """Internal method to read data from serial port."""
-        buffer = ""
+        # Raw bytes; only complete lines are decoded, so a partial line is never decoded or copied twice
+        buffer = bytearray()
         max_buffer_len = 1024 * 1024  # 1MB safety cap
+        # The port doesn't change while this thread runs; bind it and the per-line handler once
+        port = self.serial_port
+        if port is None:
+            return
+        read = port.read
+        process_line = self._process_line
         while self.is_reading and self.is_connected:
             try:
-                if self.serial_port and self.serial_port.in_waiting > 0:
-                    chunk = self.serial_port.read(self.serial_port.in_waiting).decode('utf-8', errors='ignore')
+                # Blocks until data arrives (or the read timeout), then takes everything already received
+                chunk = read(port.in_waiting or 1)
+                if chunk:
                     buffer += chunk
 
                     # Safety: if firmware stops sending newlines, buffer could grow forever.
                     if len(buffer) > max_buffer_len:
-                        buffer = buffer[-10000:]
+                        del buffer[:-10000]
                     
-                    # Process complete lines
-                    while '\n' in buffer or '\r' in buffer:
-                        if '\r\n' in buffer:
-                            line, buffer = buffer.split('\r\n', 1)
-                        elif '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                        elif '\r' in buffer:
-                            line, buffer = buffer.split('\r', 1)
-                        
-                        if line.strip():
-                            self._process_line(line.strip())
-                
-                time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+                    # Process complete lines: everything up to the last terminator, split in one pass
+                    # (\r\n, \n or a bare \r; a \r\n cut between reads only yields an empty line)
+                    end = max(buffer.rfind(b'\n'), buffer.rfind(b'\r')) + 1
+                    if end:
+                        lines = buffer[:end].splitlines()
+                        del buffer[:end]
+                        for raw_line in lines:
+                            line = raw_line.decode('utf-8', errors='ignore').strip()
+                            if line:
+                                process_line(line)
             except Exception as e:
                 print(f"Error reading serial data: {e}")
                 break
     
+    def _write_data(self):
+        """Writer thread: send all queued commands in one write and one flush per wakeup."""
+        queued = self._send_queue
+        while True:
+            self._send_ready.wait()
+            self._send_ready.clear()
+            if queued:
+                batch = [queued.popleft() for _ in range(len(queued))]
+                ok = False
+                try:
+                    self.serial_port.write(b''.join(payload for payload, _ in batch))
+                    self.serial_port.flush()
+                    ok = True
+                except Exception as e:
+                    print(f"Error sending command: {e}")
+                finally:
+                    # Always answer, or the sender would wait out its timeout
+                    for _, done in batch:
+                        done.ok = ok
+                        done.set()
+            if not self.is_connected and not queued:
+                return
+
     def _process_line(self, line: str):
         """Process a received line of data."""
         data = self.parse_data_line(line)
         if data:
-            try:
-                self.data_queue.put_nowait(data)
-            except queue.Full:
-                # Drop oldest and retry
-                try:
-                    self.data_queue.get_nowait()
-                except queue.Empty:
-                    pass
-                try:
-                    self.data_queue.put_nowait(data)
-                except queue.Full:
-                    pass
+            # The callback runs first so it can complete the sample in place before a consumer can see it
             if self.data_callback:
                 self.data_callback(data)
+            dq = self.data_queue
+            if len(dq) == dq.maxlen:
+                self.dropped += 1
+            dq.append(data)
     
     def parse_data_line(self, line: str) -> Optional[Dict[str, Any]]:
         """Parse a line of data from the device."""
@@ -112,66 +178,110 @@ class SerialCommunication:
         if is_experiment_data:
             line = line[1:]  # Remove the '>' marker
         
+        # Fast path: the exact layouts the firmware sends
+        data = self._parse_exact_layout(is_experiment_data, line)
+        if data is not None:
+            return data
+
+        # Fast path: without any field name it can only be a status line
+        if 'Time:' not in line and 'Fixed_' not in line and 'Fx:' not in line and 'Fz:' not in line:
+            return self._parse_status(is_experiment_data, line)
+
         # Parse the data format: Time:123.45,Fixed_X:1.23,Fixed_Z:4.56
-        data = {"is_experiment": is_experiment_data, "raw": line}
-        
-        # Extract time
-        time_match = re.search(r'Time:([\d.-]+)', line)
-        if time_match:
-            data["time"] = float(time_match.group(1))
-        
-        # Extract X force (supports both Simple and Force-Control modes)
-        # Simple mode: Fixed_X:<val>, Force mode: Fx:<val>
-        fx_match_fixed = re.search(r'Fixed_X:([\d.-]+)', line)
-        fx_match_fx = re.search(r'\bFx:([\d.-]+)', line)
-        if fx_match_fixed:
-            val = float(fx_match_fixed.group(1))
-            data["fixed_x"] = val
-            data["force_x"] = val if "force_x" not in data else data["force_x"]
-        if fx_match_fx:
-            val = float(fx_match_fx.group(1))
-            data["fx"] = val
-            # Prefer explicit Fx if no prior force_x set
-            if "force_x" not in data:
-                data["force_x"] = val
-        
-        # Extract Z force (supports both Simple and Force-Control modes)
-        # Simple mode: Fixed_Z:<val>, Force mode: Fz:<val>
-        fz_match_fixed = re.search(r'Fixed_Z:([\d.-]+)', line)
-        fz_match_fz = re.search(r'\bFz:([\d.-]+)', line)
-        if fz_match_fixed:
-            val = float(fz_match_fixed.group(1))
-            data["fixed_z"] = val
-            data["force_z"] = val if "force_z" not in data else data["force_z"]
-        if fz_match_fz:
-            val = float(fz_match_fz.group(1))
-            data["fz"] = val
-            if "force_z" not in data:
-                data["force_z"] = val
-        
+        # Extract time and forces from the comma-separated key:value tokens; the first occurrence of a field wins
+        fields = {}
+        for token in line.split(','):
+            name, _, value = token.partition(':')
+            key = _FIELD_KEYS.get(name.strip())
+            if key is None or key in fields:
+                continue
+            try:
+                number = float(value)
+            except ValueError:
+                # Garbled value (e.g. a line corrupted in transit); skip the field
+                continue
+            # float() also accepts "nan"/"inf", which would break the plot limits; skip those too
+            if math.isfinite(number):
+                fields[key] = number
+
+        # Simple mode sends Fixed_X/Fixed_Z, force mode Fx/Fz; prefer the fixed reading when both are present
+        force_x = fields.get("fixed_x", fields.get("fx"))
+        force_z = fields.get("fixed_z", fields.get("fz"))
+
         # Only return data if we have force readings
-        if "force_x" in data or "force_z" in data:
-            return data
-        
-        # If no force data, check for status messages
-        if any(keyword in line.lower() for keyword in ["experiment", "started", "finished", "pump", "motor"]):
+        if force_x is None and force_z is None:
+            # If no force data, check for status messages
+            return self._parse_status(is_experiment_data, line, fields)
+
+        data = {"is_experiment": is_experiment_data, "raw": line, **fields}
+        if force_x is not None:
+            data["force_x"] = force_x
+        if force_z is not None:
+            data["force_z"] = force_z
+        return data
+
+    @staticmethod
+    def _parse_exact_layout(is_experiment: bool, line: str) -> Optional[Dict[str, Any]]:
+        """Parse "Time:t,Fixed_X:x,Fixed_Z:z" or "Time:t,Fx:x,Fz:z" with straight-line code; None for anything else.
+
+        Gives the same record as the generic parser; other layouts, extra spaces or garbled or non-finite values
+        fall through to it.
+        """
+        parts = line.split(',')
+        if len(parts) != 3:
+            return None
+        t, x, z = parts
+        if not t.startswith('Time:'):
+            return None
+        isfinite = math.isfinite
+        try:
+            if x.startswith('Fixed_X:') and z.startswith('Fixed_Z:'):
+                time_s = float(t[5:])
+                force_x = float(x[8:])
+                force_z = float(z[8:])
+                # A non-finite value falls through so the generic parser drops just that field
+                if isfinite(time_s) and isfinite(force_x) and isfinite(force_z):
+                    return {"is_experiment": is_experiment, "raw": line, "time": time_s,
+                            "fixed_x": force_x, "fixed_z": force_z, "force_x": force_x, "force_z": force_z}
+            elif x.startswith('Fx:') and z.startswith('Fz:'):
+                time_s = float(t[5:])
+                force_x = float(x[3:])
+                force_z = float(z[3:])
+                if isfinite(time_s) and isfinite(force_x) and isfinite(force_z):
+                    return {"is_experiment": is_experiment, "raw": line, "time": time_s,
+                            "fx": force_x, "fz": force_z, "force_x": force_x, "force_z": force_z}
+        except ValueError:
+            pass
+        return None
+
+    @staticmethod
+    def _parse_status(is_experiment: bool, line: str, fields: Optional[Dict[str, float]] = None) -> Optional[Dict[str, Any]]:
+        """Return the line as a status message record if it is one, else None."""
+        if _RE_STATUS.search(line.lower()):
+            data = {"is_experiment": is_experiment, "raw": line}
+            if fields:
+                data.update(fields)
             data["message"] = line
             return data
             
         return None
     
     def send_command(self, command: str) -> bool:
-        """Send a command to the device."""
+        """Send a command to the device; False if not connected or the write failed."""
+        return self._send_bytes(f"{command}\n".encode('utf-8'))
+
+    def _send_bytes(self, payload: bytes) -> bool:
+        """Hand an encoded, newline-terminated command to the writer thread and wait briefly for the result."""
         if not self.is_connected or not self.serial_port:
             return False
         
-        try:
-            self.serial_port.write(f"{command}\n".encode('utf-8'))
-            self.serial_port.flush()
+        done = threading.Event()
+        self._send_queue.append((payload, done))
+        self._send_ready.set()
+        if not done.wait(self.COMMAND_TIMEOUT_S):
+            # Still writing behind earlier output; a dead port fails fast, so treat it as sent
             return True
-        except Exception as e:
-            print(f"Error sending command: {e}")
-            return False
+        return done.ok
 
     def send_config(self, params: Dict[str, Any], sensor_source: str = None) -> bool:
         """Send experiment configuration to the device.
@@ -213,28 +323,37 @@ class SerialCommunication:
     
     def start_experiment(self) -> bool:
         """Send command to start the experiment."""
-        return self.send_command("3")  # Button press simulation
+        return self._send_bytes(_CMD_START)
     
     def stop_experiment(self) -> bool:
         """Send command to stop the experiment."""
-        return self.send_command("stop")
+        return self._send_bytes(_CMD_STOP)
     
-    def get_available_ports(self) -> list:
-        """Get list of available serial ports."""
+    def get_available_ports(self, max_age_s: Optional[float] = None) -> list:
+        """Get list of available serial ports, reusing one enumerated less than max_age_s ago (default PORTS_CACHE_S)."""
+        if max_age_s is None:
+            max_age_s = self.PORTS_CACHE_S
+        now = time.monotonic()
+        cached = self._ports_cache
+        if cached is not None and now - cached[0] < max_age_s:
+            return list(cached[1])
+
         import serial.tools.list_ports
-        ports = serial.tools.list_ports.comports()
-        return [port.device for port in ports]
+        ports = [port.device for port in serial.tools.list_ports.comports()]
+        self._ports_cache = (now, ports)
+        return list(ports)
     
     def set_data_callback(self, callback: Callable):
-        """Set callback function for incoming data."""
+        """Set a function called (on the reader thread) with each parsed sample just before it is queued."""
         self.data_callback = callback
     
+    def drain(self) -> Iterator[Dict[str, Any]]:
+        """Yield and remove the queued samples, oldest first, without building a list."""
+        dq = self.data_queue
+        # Only the items present now; anything appended meanwhile stays for the next call
+        for _ in range(len(dq)):
+            yield dq.popleft()
+
     def get_queued_data(self) -> list:
         """Get all queued data and clear the queue."""
-        data_list = []
-        while not self.data_queue.empty():
-            try:
-                data_list.append(self.data_queue.get_nowait())
-            except queue.Empty:
-                break
-        return data_list
+        return list(self.drain())
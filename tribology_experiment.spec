@@ -17,6 +17,7 @@ a = Analysis(
         'tkinter.filedialog',
         'matplotlib.backends.backend_tkagg',
         'serial.tools.list_ports',
+        'pandas',  # imported lazily by data_manager, invisible to the import scanner
         'pandas._libs.tslibs.base',
         'pandas._libs.tslibs.nattype',
         'pandas._libs.tslibs.np_datetime',